@@ -2,8 +2,9 @@
 Servicio que coordina los diferentes solvers.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 from ..solvers.osmosis import OsmolaritySolver, OsmolarityComparisonSolver, TonicityClassifier, CellVolumeSolver
 from ..solvers.patch_clamp import NernstSolver, GoldmanHodgkinKatzSolver, IVCurveSolver, SingleChannelSolver
 from ..solvers.patch_clamp.single_channel import SingleChannelResult
@@ -70,6 +71,59 @@ class IVCurveResultAdapted:
     iv_curve: Any  # Para compatibilidad con el objeto IVCurveData
 
 
+# ==================== CÁLCULOS MEMORIZADOS ====================
+# Funciones puras memorizadas por sus argumentos numéricos (clics repetidos
+# con los mismos datos). Devuelven tuplas inmutables; el servicio construye
+# a partir de ellas un resultado nuevo en cada llamada
+
+# Solver usado por los cálculos memorizados (no guarda estado)
+_NERNST_SOLVER = NernstSolver()
+
+
+@lru_cache(maxsize=64)
+def _nernst(
+    ion: str,
+    z: int,
+    C_out: float,
+    C_in: float,
+    temperature_C: float
+) -> Tuple[float, Optional[str], Tuple[str, ...]]:
+    """Potencial de Nernst, interpretación y feedback."""
+    result = _NERNST_SOLVER.solve(
+        ion=ion,
+        z=z,
+        C_out=C_out,
+        C_in=C_in,
+        temperature_C=temperature_C
+    )
+    nernst_data = result.nernst_results[0] if result.nernst_results else None
+    return (
+        nernst_data.E_eq if nernst_data else 0.0,
+        result.interpretation,
+        tuple(result.feedback or [])
+    )
+
+
+@lru_cache(maxsize=64)
+def _iv_points(
+    conductance: float,
+    reversal_potential: float,
+    v_min: float,
+    v_max: float,
+    voltage_step: float
+) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+    """Voltajes y corrientes de una curva I-V óhmica."""
+    import numpy as np
+    
+    # linspace con extremos exactos (arange acumula error de coma flotante
+    # y puede añadir un punto de más)
+    n_points = int(np.floor((v_max - v_min) / voltage_step + 1e-9)) + 1
+    v = np.linspace(v_min, v_min + (n_points - 1) * voltage_step, n_points)
+    
+    # I = g * (V - E_rev)
+    return tuple(v.tolist()), tuple((conductance * (v - reversal_potential)).tolist())
+
+
 class SolverService:
     """
     Servicio que proporciona acceso unificado a todos los solvers.
@@ -261,25 +315,18 @@ class SolverService:
         c_in_final = concentration_in if concentration_in is not None else C_in
         temp_final = temperature_celsius if temperature_celsius is not None else temperature_C
         
-        result = self.nernst_solver.solve(
-            ion=ion_final,
-            z=z_final,
-            C_out=c_out_final,
-            C_in=c_in_final,
-            temperature_C=temp_final
+        E_eq, interpretation, feedback = _nernst(
+            ion_final, z_final, c_out_final, c_in_final, temp_final
         )
         
-        # Extraer resultado de Nernst
-        nernst_data = result.nernst_results[0] if result.nernst_results else None
-        
         return NernstResultAdapted(
-            equilibrium_potential=nernst_data.E_eq if nernst_data else 0.0,
+            equilibrium_potential=E_eq,
             concentration_out=c_out_final,
             concentration_in=c_in_final,
             valence=z_final,
             temperature_kelvin=temp_final + 273.15,
-            interpretation=result.interpretation,
-            feedback=result.feedback or []
+            interpretation=interpretation,
+            feedback=list(feedback)
         )
     
     def calculate_nernst_all_ions(
@@ -385,13 +432,15 @@ class SolverService:
         Returns:
             IVCurveResultAdapted con datos de curva I-V
         """
-        import numpy as np
-        
-        # Generar voltajes
-        voltages = list(np.arange(voltage_range[0], voltage_range[1] + voltage_step, voltage_step))
+        if voltage_step <= 0:
+            raise ValueError("El paso de voltaje debe ser positivo")
         
-        # Calcular corrientes: I = g * (V - E_rev)
-        currents = [conductance * (v - reversal_potential) for v in voltages]
+        v_min, v_max = voltage_range
+        if v_max < v_min:
+            raise ValueError("El voltaje máximo no puede ser menor que el mínimo")
+        cached_v, cached_i = _iv_points(conductance, reversal_potential, v_min, v_max, voltage_step)
+        voltages = list(cached_v)
+        currents = list(cached_i)
         
         # Crear objeto de curva I-V compatible
         iv_curve = IVCurveData(
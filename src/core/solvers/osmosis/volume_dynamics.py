@@ -249,8 +249,8 @@ class VolumeDynamicsSimulator:
             lysis_idx = np.where(V_percent >= critical_percent)[0]
             if len(lysis_idx) > 0:
                 lysis_detected = True
-                lysis_time = t[lysis_idx[0]]
-                lysis_volume_percent = V_percent[lysis_idx[0]]
+                lysis_time = float(t[lysis_idx[0]])
+                lysis_volume_percent = float(V_percent[lysis_idx[0]])
         
         return VolumeDynamicsResult(
             time=t,
@@ -260,7 +260,7 @@ class VolumeDynamicsSimulator:
             lysis_detected=lysis_detected,
             lysis_time=lysis_time,
             lysis_volume_percent=lysis_volume_percent,
-            final_volume_percent=V_percent[-1]
+            final_volume_percent=float(V_percent[-1])
         )
     
     def simulate_until_lysis(
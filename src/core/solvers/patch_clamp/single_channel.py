@@ -517,21 +517,21 @@ class SingleChannelSolver(BaseSolver):
             # Durante el intervalo de apertura, el canal se activa
             duration_open = t_close - t_open
             
-            for i in range(idx_open, min(idx_close, resolution)):
-                t_rel = time_points[i] - t_open  # Tiempo relativo desde apertura
-                
-                # Activación: aproximación a intensidad máxima
-                activation = 1 - np.exp(-t_rel / tau_act)
-                
-                # Para Na+: también hay inactivación durante la apertura
-                if ion == "Na+":
-                    # La inactivación comienza después de un pequeño delay
-                    t_inact = max(0, t_rel - tau_act)  # Delay antes de inactivación
-                    inactivation = np.exp(-t_inact / tau_inact)
-                    current_points[i] += intensity * activation * inactivation
-                else:
-                    # K+ no tiene inactivación significativa
-                    current_points[i] += intensity * activation
+            # Vectorizado sobre todos los puntos del intervalo
+            open_slice = slice(idx_open, min(idx_close, resolution))
+            t_rel = time_points[open_slice] - t_open  # Tiempo relativo desde apertura
+            
+            # Activación: aproximación a intensidad máxima
+            activation = 1 - np.exp(-t_rel / tau_act)
+            
+            # Para Na+: también hay inactivación durante la apertura
+            # (K+ no tiene inactivación significativa)
+            if ion == "Na+":
+                # La inactivación comienza después de un pequeño delay
+                t_inact = np.maximum(0, t_rel - tau_act)  # Delay antes de inactivación
+                activation *= np.exp(-t_inact / tau_inact)
+            
+            current_points[open_slice] += intensity * activation
             
             # 2. Fase de DESACTIVACIÓN (bajada exponencial después del cierre)
             # El canal se cierra gradualmente después de t_close
@@ -546,11 +546,10 @@ class SingleChannelSolver(BaseSolver):
                     t_inact = max(0, duration_open - tau_act)
                     I_at_close *= np.exp(-t_inact / tau_inact)
             
-            for i in range(idx_close, idx_deact_end):
-                t_rel = time_points[i] - t_close  # Tiempo desde cierre
-                # Desactivación exponencial
-                decay = np.exp(-t_rel / tau_deact)
-                current_points[i] += I_at_close * decay
+            # Desactivación exponencial (vectorizada)
+            deact_slice = slice(idx_close, idx_deact_end)
+            t_rel = time_points[deact_slice] - t_close  # Tiempo desde cierre
+            current_points[deact_slice] += I_at_close * np.exp(-t_rel / tau_deact)
         
         # Suavizar para evitar discontinuidades (filtro de media móvil simple)
         window_size = max(3, resolution // 200)
@@ -179,25 +179,17 @@ class InputForm(ctk.CTkFrame):
     
     def set_values(self, values: Dict[str, Any]):
         """
-        Establece valores en el formulario.
+        Establece varios valores en el formulario de una sola vez.
+        
+        Los campos se actualizan sin ceder el control al bucle de eventos
+        y el formulario se repinta una única vez al final.
         
         Args:
             values: Diccionario con los valores
         """
         for name, value in values.items():
-            if name in self.widgets:
-                widget = self.widgets[name]
-                
-                if isinstance(widget, ctk.CTkEntry):
-                    widget.delete(0, "end")
-                    widget.insert(0, str(value))
-                elif isinstance(widget, ctk.CTkComboBox):
-                    widget.set(str(value))
-                elif isinstance(widget, ctk.CTkCheckBox):
-                    if value:
-                        widget.select()
-                    else:
-                        widget.deselect()
+            self.set_value(name, value)
+        self.update_idletasks()
     
     def clear(self):
         """Limpia todos los campos."""
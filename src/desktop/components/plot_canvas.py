@@ -3,6 +3,7 @@ Canvas para gráficos Matplotlib embebidos.
 """
 
 import customtkinter as ctk
+from contextlib import contextmanager
 from typing import Optional, Callable
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
@@ -38,11 +39,29 @@ class PlotCanvas(ctk.CTkFrame):
         self.figure = Figure(figsize=self.figsize, dpi=self.dpi)
         self.ax = self.figure.add_subplot(111)
         
+        # Ejes dedicados por modo de gráfico (ver get_ax)
+        self._axes_cache = {}
+        
         # Crear canvas
         self.canvas = FigureCanvasTkAgg(self.figure, self)
         self.canvas_widget = self.canvas.get_tk_widget()
         self.canvas_widget.pack(fill="both", expand=True)
         
+        # Redibujado pospuesto mientras el canvas no es visible. <Expose>
+        # cubre el caso en que se vuelve a mostrar un ancestro (la vista).
+        self._draw_pending = False
+        self.canvas_widget.bind("<Map>", self._on_map, add="+")
+        self.canvas_widget.bind("<Expose>", self._on_map, add="+")
+        
+        # Redibujados suspendidos dentro de `deferred_draw` (anidable)
+        self._draw_suspended = 0
+        self._draw_requested = False
+        
+        # Blitting: artistas animados y fondo capturado en cada dibujado completo
+        self._blit_artists = []
+        self._blit_background = None
+        self.canvas.mpl_connect("draw_event", self._on_draw_event)
+        
         # Toolbar opcional
         if self.show_toolbar:
             self.toolbar_frame = ctk.CTkFrame(self)
@@ -50,15 +69,149 @@ class PlotCanvas(ctk.CTkFrame):
             self.toolbar = NavigationToolbar2Tk(self.canvas, self.toolbar_frame)
             self.toolbar.update()
     
+    def get_ax(self, mode: str, setup: Optional[Callable] = None):
+        """
+        Activa los ejes dedicados a un modo de gráfico.
+        
+        Los ejes se crean y configuran (mediante `setup`) solo la primera
+        vez; en llamadas posteriores se reutilizan sin reconstruir títulos,
+        etiquetas ni escalas. Los ejes del resto de modos se ocultan.
+        
+        Args:
+            mode: Identificador del modo (p. ej. "nernst_comp", "iv")
+            setup: Función opcional que recibe los ejes recién creados
+            
+        Returns:
+            Los ejes activos (también accesibles como `self.ax`)
+        """
+        ax = self._axes_cache.get(mode)
+        if ax is None or ax not in self.figure.axes:
+            ax = self.figure.add_subplot(111, label=mode)
+            if setup:
+                setup(ax)
+            self._axes_cache[mode] = ax
+        
+        if ax is not self.ax:
+            self.end_blit()
+        for other in self.figure.axes:
+            other.set_visible(other is ax)
+        self.ax = ax
+        return ax
+    
     def clear(self):
         """Limpia el gráfico."""
+        self.end_blit()
         self.ax.clear()
-        self.canvas.draw()
+        self.draw_idle()
 
     def draw(self):
-        """Redibuja el canvas (compatibilidad con vistas)."""
+        """
+        Redibuja el canvas (compatibilidad con vistas).
+        
+        Si el canvas no está visible (p. ej. la vista está oculta), el
+        redibujado se pospone hasta que vuelva a mostrarse.
+        """
+        if self._draw_suspended:
+            self._draw_requested = True
+            return
+        if not self.winfo_viewable():
+            self._draw_pending = True
+            return
+        self._draw_pending = False
         self.canvas.draw()
     
+    def draw_idle(self):
+        """
+        Solicita un redibujado cuando Tk quede inactivo.
+        
+        Varias solicitudes seguidas se agrupan en un único dibujado. Aplica
+        las mismas reglas de visibilidad y suspensión que `draw`.
+        """
+        if self._draw_suspended:
+            self._draw_requested = True
+            return
+        if not self.winfo_viewable():
+            self._draw_pending = True
+            return
+        self._draw_pending = False
+        self.canvas.draw_idle()
+    
+    @contextmanager
+    def deferred_draw(self):
+        """
+        Agrupa los redibujados pedidos dentro del bloque en uno solo.
+        
+        Uso:
+            with plot_canvas.deferred_draw():
+                ...  # llamadas que redibujan
+        """
+        self._draw_suspended += 1
+        try:
+            yield self
+        finally:
+            self._draw_suspended -= 1
+            if not self._draw_suspended and self._draw_requested:
+                self._draw_requested = False
+                self.draw_idle()
+    
+    def _on_map(self, event=None):
+        """Aplica un redibujado pendiente al mostrarse el canvas."""
+        if self._draw_pending:
+            self.draw_idle()
+    
+    def begin_blit(self, artists):
+        """
+        Activa el blitting para un conjunto de artistas.
+        
+        Los artistas se marcan como animados y se hace un dibujado completo
+        que captura el fondo (ejes, etiquetas, leyenda) sin ellos. Después,
+        `blit_update` solo repinta esos artistas sobre el fondo guardado.
+        
+        Args:
+            artists: Artistas que se actualizarán con frecuencia
+        """
+        self.end_blit()
+        self._blit_artists = list(artists)
+        for artist in self._blit_artists:
+            artist.set_animated(True)
+        self.draw_idle()
+    
+    @property
+    def blitting(self) -> bool:
+        """Indica si hay artistas gestionados mediante blitting."""
+        return bool(self._blit_artists)
+    
+    def end_blit(self):
+        """Desactiva el blitting y devuelve los artistas al dibujado normal."""
+        for artist in self._blit_artists:
+            artist.set_animated(False)
+        self._blit_artists = []
+        self._blit_background = None
+    
+    def blit_update(self):
+        """
+        Repinta solo los artistas animados sobre el fondo capturado.
+        
+        Si aún no hay fondo o el canvas no está visible, recurre a `draw_idle`.
+        """
+        if self._blit_background is None or not self.winfo_viewable():
+            self.draw_idle()
+            return
+        self.canvas.restore_region(self._blit_background)
+        self._draw_blit_artists()
+        self.canvas.blit(self.figure.bbox)
+    
+    def _on_draw_event(self, event):
+        """Captura el fondo tras un dibujado completo y repinta los animados."""
+        if self._blit_artists:
+            self._blit_background = self.canvas.copy_from_bbox(self.figure.bbox)
+            self._draw_blit_artists()
+    
+    def _draw_blit_artists(self):
+        """Dibuja los artistas animados sobre el buffer actual."""
+        for artist in self._blit_artists:
+            self.figure.draw_artist(artist)
+    
     def plot(
         self,
         x: list,
@@ -104,7 +257,7 @@ class PlotCanvas(ctk.CTkFrame):
             self.ax.legend()
         
         self.figure.tight_layout()
-        self.canvas.draw()
+        self.draw_idle()
     
     def plot_volume_change(
         self,
@@ -126,7 +279,7 @@ class PlotCanvas(ctk.CTkFrame):
         self.ax.legend()
         
         self.figure.tight_layout()
-        self.canvas.draw()
+        self.draw_idle()
     
     def plot_iv_curve(
         self,
@@ -160,7 +313,7 @@ class PlotCanvas(ctk.CTkFrame):
             self.ax.legend()
         
         self.figure.tight_layout()
-        self.canvas.draw()
+        self.draw_idle()
     
     def plot_boyle_vant_hoff(
         self,
@@ -203,7 +356,7 @@ class PlotCanvas(ctk.CTkFrame):
         self.ax.legend(loc="upper right", fontsize=8)
         
         self.figure.tight_layout()
-        self.canvas.draw()
+        self.draw_idle()
 
     def plot_boyle_vant_hoff_params(
         self,
@@ -251,4 +404,4 @@ class PlotCanvas(ctk.CTkFrame):
             )
         
         self.figure.tight_layout()
-        self.canvas.draw()
+        self.draw_idle()
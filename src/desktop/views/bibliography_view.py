@@ -15,9 +15,26 @@ class BibliographyView(ctk.CTkFrame):
         super().__init__(master, fg_color="transparent", **kwargs)
         
         self.app = app
+        
+        # Etiqueta de eventos compartida por todas las tarjetas: el hover
+        # se vincula una sola vez a la etiqueta (bindtags)
+        self._card_tag = f"BibliographyCard{id(self)}"
+        self._cards = set()
+        self.bind_class(self._card_tag, "<Enter>", self._on_card_enter)
+        self.bind_class(self._card_tag, "<Leave>", self._on_card_leave)
+        
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
         
+        self._font_title = ctk.CTkFont(size=22, weight="bold")
+        self._font_book_title = ctk.CTkFont(size=14, weight="bold")
+        self._font_paper_title = ctk.CTkFont(size=13, weight="bold")
+        self._font_journal = ctk.CTkFont(size=11, slant="italic")
+        self._font_large = ctk.CTkFont(size=14)
+        self._font_body = ctk.CTkFont(size=12)
+        self._font_small = ctk.CTkFont(size=11)
+        self._font_abstract = ctk.CTkFont(size=10)
+        
         self._create_widgets()
         self._load_bibliography()
     
@@ -30,14 +47,14 @@ class BibliographyView(ctk.CTkFrame):
         self.title = ctk.CTkLabel(
             header_frame,
             text="📚 Bibliografía Recomendada",
-            font=ctk.CTkFont(size=22, weight="bold")
+            font=self._font_title
         )
         self.title.grid(row=0, column=0, sticky="w")
         
         self.subtitle = ctk.CTkLabel(
             header_frame,
             text="Referencias bibliográficas del curso",
-            font=ctk.CTkFont(size=12),
+            font=self._font_body,
             text_color="gray"
         )
         self.subtitle.grid(row=1, column=0, sticky="w")
@@ -93,7 +110,7 @@ class BibliographyView(ctk.CTkFrame):
         label = ctk.CTkLabel(
             parent,
             text=f"📂 No hay {item_type} disponibles\n\nEdite data/bibliography/ para agregar {item_type}",
-            font=ctk.CTkFont(size=14),
+            font=self._font_large,
             text_color="gray",
             justify="center"
         )
@@ -116,7 +133,7 @@ class BibliographyView(ctk.CTkFrame):
         title = ctk.CTkLabel(
             header,
             text=title_text,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font_book_title,
             anchor="w",
             wraplength=500
         )
@@ -127,7 +144,7 @@ class BibliographyView(ctk.CTkFrame):
         authors_label = ctk.CTkLabel(
             card,
             text=authors,
-            font=ctk.CTkFont(size=12),
+            font=self._font_body,
             text_color="gray",
             anchor="w"
         )
@@ -146,7 +163,7 @@ class BibliographyView(ctk.CTkFrame):
             info_label = ctk.CTkLabel(
                 card,
                 text=" | ".join(info_parts),
-                font=ctk.CTkFont(size=11),
+                font=self._font_small,
                 text_color="gray"
             )
             info_label.grid(row=2, column=0, sticky="w", padx=15, pady=(2, 0))
@@ -156,7 +173,7 @@ class BibliographyView(ctk.CTkFrame):
             desc_label = ctk.CTkLabel(
                 card,
                 text=book["description"],
-                font=ctk.CTkFont(size=11),
+                font=self._font_small,
                 text_color="gray",
                 wraplength=500,
                 justify="left"
@@ -178,18 +195,7 @@ class BibliographyView(ctk.CTkFrame):
             open_btn.grid(row=0, column=0)
         
         # Efecto hover para toda la tarjeta
-        def on_enter(event):
-            card.configure(fg_color=("gray80", "gray30"))
-        
-        def on_leave(event):
-            card.configure(fg_color=("gray86", "gray17"))
-        
-        # Vincular eventos
-        for widget in card.winfo_children():
-            widget.bind("<Enter>", on_enter)
-            widget.bind("<Leave>", on_leave)
-        card.bind("<Enter>", on_enter)
-        card.bind("<Leave>", on_leave)
+        self._tag_card(card)
         
         return card
     
@@ -202,7 +208,7 @@ class BibliographyView(ctk.CTkFrame):
         title = ctk.CTkLabel(
             card,
             text=paper.get("title", "Sin título"),
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=self._font_paper_title,
             anchor="w",
             wraplength=500
         )
@@ -213,7 +219,7 @@ class BibliographyView(ctk.CTkFrame):
         authors_label = ctk.CTkLabel(
             card,
             text=authors,
-            font=ctk.CTkFont(size=11),
+            font=self._font_small,
             text_color="gray"
         )
         authors_label.grid(row=1, column=0, sticky="w", padx=15)
@@ -231,7 +237,7 @@ class BibliographyView(ctk.CTkFrame):
             journal_label = ctk.CTkLabel(
                 card,
                 text=" ".join(journal_parts),
-                font=ctk.CTkFont(size=11, slant="italic"),
+                font=self._font_journal,
                 text_color="gray"
             )
             journal_label.grid(row=2, column=0, sticky="w", padx=15, pady=(2, 0))
@@ -241,7 +247,7 @@ class BibliographyView(ctk.CTkFrame):
             abstract_label = ctk.CTkLabel(
                 card,
                 text=paper["abstract"][:200] + "..." if len(paper.get("abstract", "")) > 200 else paper["abstract"],
-                font=ctk.CTkFont(size=10),
+                font=self._font_abstract,
                 text_color="gray",
                 wraplength=500,
                 justify="left"
@@ -275,21 +281,44 @@ class BibliographyView(ctk.CTkFrame):
             doi_btn.grid(row=0, column=1)
         
         # Efecto hover para toda la tarjeta
-        def on_enter(event):
-            card.configure(fg_color=("gray80", "gray30"))
-        
-        def on_leave(event):
-            card.configure(fg_color=("gray86", "gray17"))
-        
-        # Vincular eventos a la tarjeta y sus hijos
-        for widget in card.winfo_children():
-            widget.bind("<Enter>", on_enter)
-            widget.bind("<Leave>", on_leave)
-        card.bind("<Enter>", on_enter)
-        card.bind("<Leave>", on_leave)
+        self._tag_card(card)
         
         return card
     
+    def _tag_card(self, card: ctk.CTkFrame):
+        """
+        Añade la etiqueta de eventos de tarjeta a `card` y sus descendientes.
+        
+        Los widgets de CustomTkinter son compuestos, así que la etiqueta se
+        añade a todos los widgets Tk que los forman.
+        """
+        self._cards.add(card)
+        pending = [card]
+        while pending:
+            widget = pending.pop()
+            widget.bindtags(widget.bindtags() + (self._card_tag,))
+            pending.extend(widget.winfo_children())
+    
+    def _card_of(self, widget):
+        """Devuelve la tarjeta que contiene `widget` (o None)."""
+        while widget is not None:
+            if widget in self._cards:
+                return widget
+            widget = widget.master
+        return None
+    
+    def _on_card_enter(self, event):
+        """Resalta la tarjeta bajo el cursor."""
+        card = self._card_of(event.widget)
+        if card is not None:
+            card.configure(fg_color=("gray80", "gray30"))
+    
+    def _on_card_leave(self, event):
+        """Quita el resaltado de la tarjeta."""
+        card = self._card_of(event.widget)
+        if card is not None:
+            card.configure(fg_color=("gray86", "gray17"))
+    
     def _open_doi(self, doi: str):
         """Abre el DOI en el navegador."""
         import webbrowser
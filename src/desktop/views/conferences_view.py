@@ -18,6 +18,14 @@ class ConferencesView(ctk.CTkFrame):
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
         
+        self._font_title = ctk.CTkFont(size=22, weight="bold")
+        self._font_topic = ctk.CTkFont(size=16, weight="bold")
+        self._font_order = ctk.CTkFont(size=12, weight="bold")
+        self._font_large = ctk.CTkFont(size=14)
+        self._font_item = ctk.CTkFont(size=13)
+        self._font_body = ctk.CTkFont(size=12)
+        self._font_small = ctk.CTkFont(size=11)
+        
         self._create_widgets()
         self._load_conferences()
     
@@ -31,14 +39,14 @@ class ConferencesView(ctk.CTkFrame):
         self.title = ctk.CTkLabel(
             header_frame,
             text="📖 Conferencias Digitales",
-            font=ctk.CTkFont(size=22, weight="bold")
+            font=self._font_title
         )
         self.title.grid(row=0, column=0, sticky="w")
         
         self.subtitle = ctk.CTkLabel(
             header_frame,
             text="Contenido teórico organizado por temas",
-            font=ctk.CTkFont(size=12),
+            font=self._font_body,
             text_color="gray"
         )
         self.subtitle.grid(row=1, column=0, sticky="w")
@@ -52,7 +60,7 @@ class ConferencesView(ctk.CTkFrame):
         self.empty_label = ctk.CTkLabel(
             self.main_frame,
             text="📂 No hay conferencias disponibles\n\nPara agregar conferencias:\n1. Coloque archivos PDF en data/conferences/pdfs/\n2. Edite data/conferences/_index.json",
-            font=ctk.CTkFont(size=14),
+            font=self._font_large,
             text_color="gray",
             justify="center"
         )
@@ -97,7 +105,7 @@ class ConferencesView(ctk.CTkFrame):
         topic_label = ctk.CTkLabel(
             frame,
             text=f"📁 {topic}",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font_topic
         )
         topic_label.grid(row=0, column=0, sticky="w", padx=15, pady=(15, 10))
         
@@ -117,7 +125,7 @@ class ConferencesView(ctk.CTkFrame):
         order_label = ctk.CTkLabel(
             frame,
             text=f"{conf.get('order', '?')}.",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self._font_order,
             width=30
         )
         order_label.grid(row=0, column=0, padx=(10, 5), pady=10)
@@ -126,7 +134,7 @@ class ConferencesView(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             frame,
             text=conf.get("title", "Sin título"),
-            font=ctk.CTkFont(size=13),
+            font=self._font_item,
             anchor="w"
         )
         title_label.grid(row=0, column=1, sticky="w", pady=10)
@@ -145,7 +153,7 @@ class ConferencesView(ctk.CTkFrame):
             no_file_label = ctk.CTkLabel(
                 frame,
                 text="Sin archivo",
-                font=ctk.CTkFont(size=11),
+                font=self._font_small,
                 text_color="gray"
             )
             no_file_label.grid(row=0, column=2, padx=10, pady=10)
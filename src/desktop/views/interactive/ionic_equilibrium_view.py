@@ -4,14 +4,33 @@ Vista interactiva del módulo de Equilibrio Iónico.
 
 import customtkinter as ctk
 import tkinter as tk
+import numpy as np
+from functools import partial
+from types import MappingProxyType
 from typing import Optional
 
 from ...components.input_form import InputForm, FormField
 from ...components.result_panel import ResultPanel
 from ...components.plot_canvas import PlotCanvas
+from .solver_jobs import ION_TRANSLATE, SolverJobsMixin
 
 
-class IonicEquilibriumView(ctk.CTkFrame):
+# Valores típicos de referencia para la comparación de potenciales (mV)
+_NERNST_IONS = ("K⁺", "Na⁺", "Ca²⁺", "Cl⁻")
+_NERNST_DEFAULTS = np.array([-90.0, 60.0, 120.0, -70.0])
+
+# Campos del panel de resultados de Nernst: (etiqueta, formato(resultado, ion))
+_NERNST_FIELDS = (
+    ("Ion", lambda r, ion: ion),
+    ("Potencial de Nernst", lambda r, ion: f"{r.equilibrium_potential:.2f} mV"),
+    ("[Ion] externa", lambda r, ion: f"{r.concentration_out:.4g} mM"),
+    ("[Ion] interna", lambda r, ion: f"{r.concentration_in:.4g} mM"),
+    ("Valencia", lambda r, ion: f"{r.valence:+d}"),
+    ("Temperatura", lambda r, ion: f"{r.temperature_kelvin - 273.15:.1f}°C"),
+)
+
+
+class IonicEquilibriumView(SolverJobsMixin, ctk.CTkFrame):
     """
     Vista interactiva para el módulo de Equilibrio Iónico.
     
@@ -19,8 +38,8 @@ class IonicEquilibriumView(ctk.CTkFrame):
     - Potencial de Nernst (iones predefinidos y personalizados)
     """
     
-    # Iones predefinidos con sus propiedades
-    PREDEFINED_IONS = {
+    # Iones predefinidos con sus propiedades (tabla de solo lectura)
+    PREDEFINED_IONS = MappingProxyType({
         "K⁺": {"valencia": 1, "conc_ext": 5, "conc_int": 140},
         "Na⁺": {"valencia": 1, "conc_ext": 145, "conc_int": 12},
         "Ca²⁺": {"valencia": 2, "conc_ext": 2, "conc_int": 0.0001},
@@ -29,7 +48,7 @@ class IonicEquilibriumView(ctk.CTkFrame):
         "Mg²⁺": {"valencia": 2, "conc_ext": 1.5, "conc_int": 0.5},
         "HCO₃⁻": {"valencia": -1, "conc_ext": 24, "conc_int": 10},
         "Personalizado": {"valencia": 1, "conc_ext": 1, "conc_int": 1},
-    }
+    })
     
     def __init__(self, master, app=None, **kwargs):
         super().__init__(master, fg_color="transparent", **kwargs)
@@ -37,9 +56,18 @@ class IonicEquilibriumView(ctk.CTkFrame):
         self.app = app
         self.solver_service = app.solver_service if app else None
         
+        # Artistas del gráfico de comparación (iones, barras, etiquetas)
+        self._nernst_artists = None
+        
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
         
+        self._font_title = ctk.CTkFont(size=22, weight="bold")
+        self._font_subtitle = ctk.CTkFont(size=12)
+        self._font_info = ctk.CTkFont(size=11)
+        self._font_note = ctk.CTkFont(size=10)
+        self._font_bold = ctk.CTkFont(size=12, weight="bold")
+        
         self._create_widgets()
     
     def _create_widgets(self):
@@ -51,14 +79,14 @@ class IonicEquilibriumView(ctk.CTkFrame):
         self.title = ctk.CTkLabel(
             header,
             text="⚖️ Módulo de Equilibrio Iónico",
-            font=ctk.CTkFont(size=22, weight="bold")
+            font=self._font_title
         )
         self.title.grid(row=0, column=0, sticky="w")
         
         self.subtitle = ctk.CTkLabel(
             header,
             text="Potencial de Nernst y equilibrio electroquímico",
-            font=ctk.CTkFont(size=12),
+            font=self._font_subtitle,
             text_color="gray"
         )
         self.subtitle.grid(row=1, column=0, sticky="w")
@@ -133,7 +161,7 @@ class IonicEquilibriumView(ctk.CTkFrame):
             self.tab_nernst,
             text="Potencial de equilibrio de un ion\n"
                  "Eᵢ = (RT/zF) × ln([ion]ₑ/[ion]ᵢ)",
-            font=ctk.CTkFont(size=11),
+            font=self._font_info,
             text_color="gray",
             justify="left"
         )
@@ -152,7 +180,7 @@ class IonicEquilibriumView(ctk.CTkFrame):
         ctk.CTkLabel(
             ion_frame,
             text="Seleccionar Ion:",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=self._font_bold
         ).grid(row=0, column=0, sticky="w", padx=10, pady=5)
         
         self.ion_selector = ctk.CTkComboBox(
@@ -168,7 +196,7 @@ class IonicEquilibriumView(ctk.CTkFrame):
         note = ctk.CTkLabel(
             form_frame,
             text="💡 Selecciona 'Personalizado' para introducir un ion diferente",
-            font=ctk.CTkFont(size=10),
+            font=self._font_note,
             text_color="gray"
         )
         note.grid(row=1, column=0, sticky="w", padx=10, pady=(0, 10))
@@ -181,7 +209,7 @@ class IonicEquilibriumView(ctk.CTkFrame):
         ctk.CTkLabel(
             self.custom_ion_frame,
             text="Nombre del ion:",
-            font=ctk.CTkFont(size=11)
+            font=self._font_info
         ).grid(row=0, column=0, sticky="w", padx=10, pady=5)
         
         self.custom_ion_name = ctk.CTkEntry(
@@ -219,12 +247,18 @@ class IonicEquilibriumView(ctk.CTkFrame):
             # Autocompletar valores
             if choice in self.PREDEFINED_IONS:
                 ion_data = self.PREDEFINED_IONS[choice]
-                self.nernst_form.set_value("conc_out", str(ion_data["conc_ext"]))
-                self.nernst_form.set_value("conc_in", str(ion_data["conc_int"]))
-                self.nernst_form.set_value("valence", str(ion_data["valencia"]))
+                self.nernst_form.set_values({
+                    "conc_out": ion_data["conc_ext"],
+                    "conc_in": ion_data["conc_int"],
+                    "valence": ion_data["valencia"],
+                })
     
     def _calculate_nernst(self, data: dict):
-        """Calcula el potencial de Nernst."""
+        """Programa el cálculo del potencial de Nernst."""
+        self._debounce("nernst", self._do_calculate_nernst, data)
+    
+    def _do_calculate_nernst(self, data: dict):
+        """Lanza el cálculo del potencial de Nernst."""
         if not self.solver_service:
             self.result_panel.show_error("Servicio no disponible")
             return
@@ -241,9 +275,9 @@ class IonicEquilibriumView(ctk.CTkFrame):
                 ion = selected_ion
             
             # Obtener valores
-            conc_out = float(data.get("conc_out", 5))
-            conc_in = float(data.get("conc_in", 140))
-            temp = float(data.get("temperature", 37))
+            conc_out = self._f(data, "conc_out", 5)
+            conc_in = self._f(data, "conc_in", 140)
+            temp = self._f(data, "temperature", 37)
             valence_str = data.get("valence", "1")
             valence = int(float(valence_str)) if valence_str else 1
             
@@ -252,24 +286,30 @@ class IonicEquilibriumView(ctk.CTkFrame):
                 self.result_panel.show_error("La valencia no puede ser cero")
                 return
             
-            # Calcular
-            result = self.solver_service.calculate_nernst(
-                ion_name=ion.replace("⁺", "+").replace("⁻", "-").replace("²", "2").replace("³", "3"),
-                concentration_out=conc_out,
-                concentration_in=conc_in,
-                valence=valence,
-                temperature_celsius=temp
+            # Calcular en segundo plano
+            self._submit_job(
+                self.nernst_form,
+                partial(
+                    self.solver_service.calculate_nernst,
+                    ion_name=ion.translate(ION_TRANSLATE),
+                    concentration_out=conc_out,
+                    concentration_in=conc_in,
+                    valence=valence,
+                    temperature_celsius=temp
+                ),
+                partial(self._on_nernst_done, ion=ion)
             )
             
+        except ValueError as e:
+            self.result_panel.show_error(f"Error en los datos: {e}")
+    
+    def _on_nernst_done(self, future, ion: str):
+        """Muestra el potencial de Nernst calculado en segundo plano."""
+        try:
+            result = future.result()
+            
             # Mostrar resultados
-            results_data = {
-                "Ion": ion,
-                "Potencial de Nernst": f"{result.equilibrium_potential:.2f} mV",
-                "[Ion] externa": f"{result.concentration_out:.4g} mM",
-                "[Ion] interna": f"{result.concentration_in:.4g} mM",
-                "Valencia": f"{result.valence:+d}",
-                "Temperatura": f"{result.temperature_kelvin - 273.15:.1f}°C"
-            }
+            results_data = {key: fmt(result, ion) for key, fmt in _NERNST_FIELDS}
             
             self.result_panel.show_results(
                 title="📊 Potencial de Nernst",
@@ -278,48 +318,75 @@ class IonicEquilibriumView(ctk.CTkFrame):
                 feedback=result.feedback
             )
             
-            # Graficar comparación con otros iones
-            self._plot_nernst_comparison(ion, result.equilibrium_potential)
+            # Graficar comparación con otros iones (tras pintar los resultados)
+            self.after_idle(self._plot_nernst_comparison, ion, result.equilibrium_potential)
             
         except ValueError as e:
             self.result_panel.show_error(f"Error en los datos: {e}")
         except Exception as e:
             self.result_panel.show_error(f"Error de cálculo: {e}")
     
+    def _setup_nernst_axes(self, ax):
+        """Configura una sola vez los elementos fijos del gráfico de comparación."""
+        ax.axvline(x=0, color="gray", linestyle="--", alpha=0.5)
+        ax.axvline(x=-70, color="red", linestyle=":", alpha=0.5, label="Vm reposo")
+        ax.set_xlabel("Potencial (mV)")
+        ax.set_title("Potenciales de Equilibrio")
+        ax.legend(loc="lower right", fontsize=8)
+    
     def _plot_nernst_comparison(self, current_ion: str, current_potential: float):
         """Grafica comparación de potenciales de Nernst."""
-        # Valores típicos de referencia
-        typical = {
-            "K⁺": -90.0,
-            "Na⁺": 60.0,
-            "Ca²⁺": 120.0,
-            "Cl⁻": -70.0
-        }
-        
         # Actualizar con el valor calculado
-        typical[current_ion] = float(current_potential)
-        
-        ions = list(typical.keys())
-        potentials = list(typical.values())
-        colors = ["steelblue" if ion != current_ion else "orange" for ion in ions]
-        
-        self.plot_canvas.clear()
-        bars = self.plot_canvas.ax.barh(ions, potentials, color=colors)
-        self.plot_canvas.ax.axvline(x=0, color="gray", linestyle="--", alpha=0.5)
-        self.plot_canvas.ax.axvline(x=-70, color="red", linestyle=":", alpha=0.5, label="Vm reposo")
-        self.plot_canvas.ax.set_xlabel("Potencial (mV)")
-        self.plot_canvas.ax.set_title("Potenciales de Equilibrio")
-        
-        # Anotar valores
-        for bar, val in zip(bars, potentials):
-            self.plot_canvas.ax.text(
-                val + 3 if val >= 0 else val - 3,
-                bar.get_y() + bar.get_height()/2,
-                f"{val:.0f}",
-                va="center",
-                ha="left" if val >= 0 else "right",
-                fontsize=9
-            )
+        if current_ion in _NERNST_IONS:
+            ions, potentials = _NERNST_IONS, _NERNST_DEFAULTS.copy()
+        else:
+            ions = (*_NERNST_IONS, current_ion)
+            potentials = np.append(_NERNST_DEFAULTS, current_potential)
+        
+        current = np.asarray(ions) == current_ion
+        potentials[current] = current_potential
+        colors = np.where(current, "orange", "steelblue").tolist()
+        labels = [f"{val:.0f}" for val in potentials]
+        ax = self.plot_canvas.get_ax("nernst_comp", setup=self._setup_nernst_axes)
+        
+        if self._nernst_artists is not None and self._nernst_artists[0] == ions:
+            # Mismo conjunto de iones: actualizar barras y etiquetas existentes
+            # (se conservan los textos para aprovechar su caché de métricas)
+            _, bars, texts = self._nernst_artists
+            positive = potentials >= 0
+            x_offsets = np.where(positive, 3.0, -3.0)
+            alignments = np.where(positive, "left", "right")
+            for bar, text, val, x_off, ha, label, color in zip(
+                bars, texts, potentials, x_offsets, alignments, labels, colors
+            ):
+                bar.set_width(val)
+                bar.set_facecolor(color)
+                text.xy = (val, bar.get_y() + bar.get_height() / 2)
+                text.xyann = (x_off, 0)
+                text.set_ha(ha)
+                text.set_text(label)
+        else:
+            # Nuevo conjunto de iones: sustituir barras y etiquetas
+            if self._nernst_artists is not None:
+                _, bars, texts = self._nernst_artists
+                bars.remove()
+                for text in texts:
+                    text.remove()
+            positions = np.arange(len(ions))
+            bars = ax.barh(positions, potentials, color=colors)
+            ax.set_yticks(positions, ions)
+            texts = ax.bar_label(bars, labels=labels, padding=3, fontsize=9)
+            self._nernst_artists = (ions, bars, texts)
+            ax.relim()
+            ax.autoscale_view()
+            self.plot_canvas.begin_blit([*bars, *texts])
+            return
         
-        self.plot_canvas.ax.legend(loc="lower right", fontsize=8)
-        self.plot_canvas.draw()
+        # Si la escala no cambia basta con repintar barras y etiquetas
+        xlim = ax.get_xlim()
+        ax.relim()
+        ax.autoscale_view()
+        if ax.get_xlim() == xlim:
+            self.plot_canvas.blit_update()
+        else:
+            self.plot_canvas.draw_idle()
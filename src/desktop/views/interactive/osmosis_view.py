@@ -380,7 +380,7 @@ class OsmosisView(ctk.CTkFrame):
                 self.plot_canvas.figure,
                 result, critical_volume
             )
-        self.plot_canvas.draw()
+        self.plot_canvas.draw_idle()
     
     def _show_normal_results(
         self, result,
@@ -416,7 +416,7 @@ class OsmosisView(ctk.CTkFrame):
                 self.plot_canvas.figure,
                 result
             )
-        self.plot_canvas.draw()
+        self.plot_canvas.draw_idle()
     
     # ==================== Ejemplos ====================
     
@@ -1,18 +1,89 @@
 """
 Vista interactiva del módulo de Patch Clamp.
+
+Notas de rendimiento: esta vista está limitada por la latencia del hilo de
+Tk, no por cálculo numérico. Los datos son pequeños (decenas de puntos en la
+curva I-V, un vector temporal de ~1000 puntos en el registro), así que el
+coste lo dominan la creación de widgets y el redibujado de Matplotlib. Por
+ello se prefiere: (a) ejecutar los solvers fuera del hilo de Tk, (b)
+reutilizar los ejes por modo (`get_ax`), las líneas del registro y el
+blitting, y (c) crear fuentes, tablas de iones y escenarios una sola vez a
+nivel de módulo o de vista. No compensa vectorizar con SIMD/GPU ni
+compilar con JIT: el arranque del compilador costaría más que los propios
+cálculos.
 """
 
 import customtkinter as ctk
 import tkinter as tk
 import numpy as np
+from functools import partial
 from typing import Optional
 
 from ...components.input_form import InputForm, FormField
 from ...components.result_panel import ResultPanel
 from ...components.plot_canvas import PlotCanvas
+from .solver_jobs import ION_TRANSLATE, SolverJobsMixin
+
+
+# Opciones de grid comunes a los botones de ejemplo
+_BTN_GRID = {"padx": 5, "pady": (5, 10)}
+
+# Canales típicos para la curva I-V: (nombre, valores del formulario)
+_IV_CHANNELS = (
+    ("Canal K⁺", {"conductance": "20", "reversal_potential": "-80"}),
+    ("Canal Na⁺", {"conductance": "20", "reversal_potential": "+50"}),
+    ("Canal Cl⁻", {"conductance": "15", "reversal_potential": "-70"}),
+)
+
+# Campos del panel de resultados de la curva I-V: (etiqueta, formato(resultado, v_min, v_max))
+_IV_FIELDS = (
+    ("Conductancia", lambda r, v_min, v_max: f"{r.conductance:.2f} pS"),
+    ("Potencial de reversión", lambda r, v_min, v_max: f"{r.reversal_potential:.1f} mV"),
+    ("Rango de voltaje", lambda r, v_min, v_max: f"{v_min:.0f} a {v_max:.0f} mV"),
+    ("Puntos generados", lambda r, v_min, v_max: str(len(r.voltages))),
+)
+
+# Escenarios de registro de canal único: (nombre, valores del formulario).
+# El potencial de equilibrio se resetea para usar el valor por defecto.
+_SINGLE_CHANNEL_SCENARIOS = (
+    ("Na⁺ Despolarizado", {"ion": "Na⁺", "membrane_potential": "0", "equilibrium_potential": ""}),
+    ("Na⁺ Reposo", {"ion": "Na⁺", "membrane_potential": "-70", "equilibrium_potential": ""}),
+    ("K⁺ Despolarizado", {"ion": "K⁺", "membrane_potential": "0", "equilibrium_potential": ""}),
+)
+
+# Número máximo de tramos horizontales que se envían a Matplotlib por curva
+_DISPLAY_BUCKETS = 1200
+
+
+def _decimate(t, y, buckets: int = _DISPLAY_BUCKETS):
+    """
+    Reduce una curva densa para mostrarla conservando su envolvente.
+    
+    Agrupa los puntos en `buckets` tramos y conserva el mínimo y el máximo
+    de cada uno (MinMax), de modo que los picos siguen siendo visibles.
+    Las curvas que ya son pequeñas se devuelven sin cambios (en float32).
+    
+    Args:
+        t: Tiempos de la curva
+        y: Valores de la curva
+        buckets: Número de tramos a conservar
+        
+    Returns:
+        Tupla (t, y) de arrays float32 listos para graficar
+    """
+    t = np.asarray(t, dtype=np.float32)
+    y = np.asarray(y, dtype=np.float32)
+    n = len(t)
+    if n <= 2 * buckets:
+        return t, y
+    step = n // buckets
+    used = step * buckets
+    chunks = y[:used].reshape(buckets, step)
+    envelope = np.stack([chunks.min(axis=1), chunks.max(axis=1)], axis=1).ravel()
+    return np.repeat(t[:used:step], 2), envelope
 
 
-class PatchClampView(ctk.CTkFrame):
+class PatchClampView(SolverJobsMixin, ctk.CTkFrame):
     """
     Vista interactiva para el módulo de Patch Clamp.
     
@@ -27,9 +98,22 @@ class PatchClampView(ctk.CTkFrame):
         self.app = app
         self.solver_service = app.solver_service if app else None
         
+        # Líneas del registro de canal único (se crean con sus ejes) y clave
+        # de la escala/título vigentes, para redibujar solo los datos
+        self._cont_line = None
+        self._rect_line = None
+        self._sc_title = None
+        self._sc_legend = None
+        self._single_channel_key = None
+        
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
         
+        self._font_title = ctk.CTkFont(size=22, weight="bold")
+        self._font_subtitle = ctk.CTkFont(size=12)
+        self._font_info = ctk.CTkFont(size=11)
+        self._font_bold = ctk.CTkFont(size=12, weight="bold")
+        
         self._create_widgets()
     
     def _create_widgets(self):
@@ -41,14 +125,14 @@ class PatchClampView(ctk.CTkFrame):
         self.title = ctk.CTkLabel(
             header,
             text="⚡ Módulo Interactivo de Patch Clamp",
-            font=ctk.CTkFont(size=22, weight="bold")
+            font=self._font_title
         )
         self.title.grid(row=0, column=0, sticky="w")
         
         self.subtitle = ctk.CTkLabel(
             header,
             text="Curvas I-V y Registro de Canal Único",
-            font=ctk.CTkFont(size=12),
+            font=self._font_subtitle,
             text_color="gray"
         )
         self.subtitle.grid(row=1, column=0, sticky="w")
@@ -74,8 +158,14 @@ class PatchClampView(ctk.CTkFrame):
         self.tab_iv = self.tabs.add("Curva I-V")
         self.tab_single_channel = self.tabs.add("Registro")
         
-        self._setup_iv_tab()
-        self._setup_single_channel_tab()
+        # Solo se construye la pestaña inicial; el resto al seleccionarla
+        self._tab_builders = {
+            "Curva I-V": self._setup_iv_tab,
+            "Registro": self._setup_single_channel_tab,
+        }
+        self._tabs_built = set()
+        self.tabs.configure(command=self._on_tab_changed)
+        self._build_tab("Curva I-V")
         
         # Panel derecho con PanedWindow vertical
         right_outer = ctk.CTkFrame(self.main_paned)
@@ -115,6 +205,18 @@ class PatchClampView(ctk.CTkFrame):
         self.main_paned.add(left_frame, minsize=380, stretch="always")
         self.main_paned.add(right_outer, minsize=400, stretch="always")
     
+    def _on_tab_changed(self):
+        """Construye el contenido de una pestaña la primera vez que se muestra."""
+        self._build_tab(self.tabs.get())
+    
+    def _build_tab(self, name: str):
+        """Construye una pestaña una sola vez (ignora nombres desconocidos)."""
+        builder = self._tab_builders.get(name)
+        if builder is None or name in self._tabs_built:
+            return
+        self._tabs_built.add(name)
+        builder()
+    
     def _setup_iv_tab(self):
         """Configura el tab de curva I-V."""
         self.tab_iv.grid_columnconfigure(0, weight=1)
@@ -124,7 +226,7 @@ class PatchClampView(ctk.CTkFrame):
             self.tab_iv,
             text="Generar curva corriente-voltaje\n"
                  "I = g × (Vm - Erev)",
-            font=ctk.CTkFont(size=11),
+            font=self._font_info,
             text_color="gray",
             justify="left"
         )
@@ -153,24 +255,18 @@ class PatchClampView(ctk.CTkFrame):
         ctk.CTkLabel(
             channels_frame,
             text="📋 Canales Típicos:",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=self._font_bold
         ).grid(row=0, column=0, columnspan=3, sticky="w", padx=10, pady=(10, 5))
         
-        channels = [
-            ("Canal K⁺", "20", "-80"),
-            ("Canal Na⁺", "20", "+50"),
-            ("Canal Cl⁻", "15", "-70"),
-        ]
-        
-        for i, (name, g, e_rev) in enumerate(channels):
+        for i, (name, values) in enumerate(_IV_CHANNELS):
             btn = ctk.CTkButton(
                 channels_frame,
                 text=name,
                 width=90,
                 height=28,
-                command=lambda cond=g, rev=e_rev: self._set_iv_example(cond, rev)
+                command=partial(self.iv_form.set_values, values)
             )
-            btn.grid(row=1, column=i, padx=5, pady=(5, 10))
+            btn.grid(row=1, column=i, **_BTN_GRID)
     
     def _setup_single_channel_tab(self):
         """Configura el tab de registro de canal único."""
@@ -181,7 +277,7 @@ class PatchClampView(ctk.CTkFrame):
             self.tab_single_channel,
             text="Simulación de registro de canal único\n"
                  "Genera gráfica de corriente vs tiempo",
-            font=ctk.CTkFont(size=11),
+            font=self._font_info,
             text_color="gray",
             justify="left"
         )
@@ -215,7 +311,7 @@ class PatchClampView(ctk.CTkFrame):
         ctk.CTkLabel(
             options_frame,
             text="🔧 Opciones de visualización:",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=self._font_bold
         ).grid(row=0, column=0, sticky="w", padx=10, pady=(10, 5))
         
         # Variable para el switch de forma de onda continua
@@ -227,7 +323,7 @@ class PatchClampView(ctk.CTkFrame):
             variable=self.use_continuous_waveform,
             onvalue=True,
             offvalue=False,
-            font=ctk.CTkFont(size=11)
+            font=self._font_info
         )
         self.continuous_switch.grid(row=1, column=0, sticky="w", padx=15, pady=(5, 10))
         
@@ -238,26 +334,24 @@ class PatchClampView(ctk.CTkFrame):
         ctk.CTkLabel(
             scenarios_frame,
             text="🧪 Escenarios:",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=self._font_bold
         ).grid(row=0, column=0, columnspan=3, sticky="w", padx=10, pady=(10, 5))
         
-        scenarios = [
-            ("Na⁺ Despolarizado", "Na⁺", "0"),
-            ("Na⁺ Reposo", "Na⁺", "-70"),
-            ("K⁺ Despolarizado", "K⁺", "0"),
-        ]
-        
-        for i, (name, ion, vm) in enumerate(scenarios):
+        for i, (name, values) in enumerate(_SINGLE_CHANNEL_SCENARIOS):
             btn = ctk.CTkButton(
                 scenarios_frame,
                 text=name,
                 width=110,
                 height=28,
-                command=lambda io=ion, v=vm: self._set_single_channel_example(io, v)
+                command=partial(self.single_channel_form.set_values, values)
             )
-            btn.grid(row=1, column=i, padx=5, pady=(5, 10))
+            btn.grid(row=1, column=i, **_BTN_GRID)
     
     def _calculate_iv(self, data: dict):
+        """Programa la generación de la curva I-V."""
+        self._debounce("iv", self._do_calculate_iv, data)
+    
+    def _do_calculate_iv(self, data: dict):
         """Genera la curva I-V."""
         if not self.solver_service:
             self.result_panel.show_error("Servicio no disponible")
@@ -265,30 +359,35 @@ class PatchClampView(ctk.CTkFrame):
         
         try:
             # Obtener valores
-            g = float(data.get("conductance", 1.0))
-            e_rev = float(data.get("reversal_potential", -80))
-            v_min = float(data.get("v_min", -100))
-            v_max = float(data.get("v_max", 50))
-            v_step = float(data.get("v_step", 10))
-            
-            # Generar voltajes
-            voltages = list(np.arange(v_min, v_max + v_step, v_step))
+            g = self._f(data, "conductance", 1.0)
+            e_rev = self._f(data, "reversal_potential", -80)
+            v_min = self._f(data, "v_min", -100)
+            v_max = self._f(data, "v_max", 50)
+            v_step = self._f(data, "v_step", 10)
             
-            # Calcular
-            result = self.solver_service.generate_iv_curve(
-                conductance=g,
-                reversal_potential=e_rev,
-                voltage_range=(v_min, v_max),
-                voltage_step=v_step
+            # Calcular en segundo plano
+            self._submit_job(
+                self.iv_form,
+                partial(
+                    self.solver_service.generate_iv_curve,
+                    conductance=g,
+                    reversal_potential=e_rev,
+                    voltage_range=(v_min, v_max),
+                    voltage_step=v_step
+                ),
+                partial(self._on_iv_done, e_rev=e_rev, v_min=v_min, v_max=v_max)
             )
             
+        except ValueError as e:
+            self.result_panel.show_error(f"Error en los datos: {e}")
+    
+    def _on_iv_done(self, future, e_rev: float, v_min: float, v_max: float):
+        """Muestra la curva I-V calculada en segundo plano."""
+        try:
+            result = future.result()
+            
             # Mostrar resultados
-            results_data = {
-                "Conductancia": f"{g:.2f} pS",
-                "Potencial de reversión": f"{e_rev:.1f} mV",
-                "Rango de voltaje": f"{v_min:.0f} a {v_max:.0f} mV",
-                "Puntos generados": str(len(result.voltages))
-            }
+            results_data = {key: fmt(result, v_min, v_max) for key, fmt in _IV_FIELDS}
             
             self.result_panel.show_results(
                 title="📊 Curva I-V Generada",
@@ -297,27 +396,34 @@ class PatchClampView(ctk.CTkFrame):
                               f"La corriente cambia de dirección en este punto."
             )
             
-            # Graficar curva I-V
+            # Graficar curva I-V (tras pintar los resultados)
             if result.iv_curve:
-                self.plot_canvas.plot_iv_curve(
-                    voltage=result.iv_curve.voltage,
-                    current=result.iv_curve.current,
-                    reversal_potential=e_rev,
-                    title="Curva I-V"
-                )
+                self.after_idle(self._plot_iv_curve, result.iv_curve, e_rev)
             
         except ValueError as e:
             self.result_panel.show_error(f"Error en los datos: {e}")
         except Exception as e:
             self.result_panel.show_error(f"Error de cálculo: {e}")
     
-    def _set_iv_example(self, conductance: str, reversal: str):
-        """Establece valores de ejemplo para curva I-V."""
-        self.iv_form.set_value("conductance", conductance)
-        self.iv_form.set_value("reversal_potential", reversal)
+    def _plot_iv_curve(self, iv_curve, reversal_potential: float):
+        """Grafica la curva I-V en sus ejes dedicados."""
+        # clear() y el trazado piden su propio redibujado: agruparlos en uno
+        with self.plot_canvas.deferred_draw():
+            self.plot_canvas.get_ax("iv")
+            # Convertir una sola vez a ndarray contiguo para matplotlib
+            self.plot_canvas.plot_iv_curve(
+                voltage=np.asarray(iv_curve.voltage, dtype=np.float64),
+                current=np.asarray(iv_curve.current, dtype=np.float64),
+                reversal_potential=reversal_potential,
+                title="Curva I-V"
+            )
     
     def _calculate_single_channel(self, data: dict):
-        """Calcula y grafica el registro de canal único."""
+        """Programa la simulación del registro de canal único."""
+        self._debounce("single_channel", self._do_calculate_single_channel, data)
+    
+    def _do_calculate_single_channel(self, data: dict):
+        """Lanza la simulación del registro de canal único."""
         if not self.solver_service:
             self.result_panel.show_error("Servicio no disponible")
             return
@@ -325,11 +431,11 @@ class PatchClampView(ctk.CTkFrame):
         try:
             # Obtener valores
             ion_raw = data.get("ion", "Na⁺")
-            ion = ion_raw.replace("⁺", "+").replace("⁻", "-")
+            ion = ion_raw.translate(ION_TRANSLATE)
             
-            membrane_potential = float(data.get("membrane_potential", -20))
-            conductance = float(data.get("conductance", 20))
-            time_range = float(data.get("time_range", 20))
+            membrane_potential = self._f(data, "membrane_potential", -20)
+            conductance = self._f(data, "conductance", 20)
+            time_range = self._f(data, "time_range", 20)
             
             # Tipo de forma de onda (desde el switch)
             use_continuous = self.use_continuous_waveform.get()
@@ -338,15 +444,28 @@ class PatchClampView(ctk.CTkFrame):
             eq_pot_str = data.get("equilibrium_potential", "").strip()
             equilibrium_potential = float(eq_pot_str) if eq_pot_str else None
             
-            # Simular
-            result = self.solver_service.simulate_single_channel(
-                ion=ion,
-                membrane_potential=membrane_potential,
-                conductance=conductance,
-                equilibrium_potential=equilibrium_potential,
-                time_range_ms=time_range
+            # Simular en segundo plano
+            self._submit_job(
+                self.single_channel_form,
+                partial(
+                    self.solver_service.simulate_single_channel,
+                    ion=ion,
+                    membrane_potential=membrane_potential,
+                    conductance=conductance,
+                    equilibrium_potential=equilibrium_potential,
+                    time_range_ms=time_range
+                ),
+                partial(self._on_single_channel_done, ion_raw=ion_raw, use_continuous=use_continuous)
             )
             
+        except ValueError as e:
+            self.result_panel.show_error(f"Error en los datos: {e}")
+    
+    def _on_single_channel_done(self, future, ion_raw: str, use_continuous: bool):
+        """Muestra el registro de canal único simulado en segundo plano."""
+        try:
+            result = future.result()
+            
             if not result.success:
                 self.result_panel.show_error(result.error_message or "Error en la simulación")
                 return
@@ -354,8 +473,9 @@ class PatchClampView(ctk.CTkFrame):
             channel_data = result.channel_data
             
             # Mostrar resultados
-            num_openings = len(channel_data.activation_intervals)
-            total_open_time = sum(t1 - t0 for t0, t1 in channel_data.time_intervals_ms)
+            intervals = np.asarray(channel_data.time_intervals_ms, dtype=np.float64).reshape(-1, 2)
+            num_openings = intervals.shape[0]
+            total_open_time = float(intervals[:, 1].sum() - intervals[:, 0].sum())
             open_prob = (total_open_time / channel_data.time_range_ms * 100) if channel_data.time_range_ms > 0 else 0
             
             results_data = {
@@ -384,86 +504,95 @@ class PatchClampView(ctk.CTkFrame):
                 feedback=result.feedback
             )
             
-            # Graficar corriente vs tiempo
-            self._plot_single_channel_recording(result, use_continuous=use_continuous)
+            # Graficar corriente vs tiempo (tras pintar los resultados)
+            self.after_idle(self._plot_single_channel_recording, result, use_continuous)
             
         except ValueError as e:
             self.result_panel.show_error(f"Error en los datos: {e}")
         except Exception as e:
             self.result_panel.show_error(f"Error de cálculo: {e}")
     
+    def _setup_single_channel_axes(self, ax):
+        """Configura una sola vez los ejes y las líneas del registro."""
+        ax.set(xlabel="Tiempo (ms)", ylabel="Corriente (pA)")
+        ax.grid(True, alpha=0.3)
+        
+        # Línea base en 0
+        ax.axhline(y=0, color="gray", linestyle="--", alpha=0.5, linewidth=0.8)
+        
+        # Una línea por tipo de onda; se actualizan con set_data
+        self._cont_line, = ax.plot([], [], color="coral", linewidth=1.5, label="Continua")
+        self._rect_line, = ax.plot([], [], color="steelblue", linewidth=1.5, drawstyle="steps-post")
+        
+        # Título y leyenda persistentes: solo se cambia su texto
+        self._sc_title = ax.set_title("")
+        self._sc_legend = ax.legend(handles=[self._cont_line], title="", loc="best", fontsize=8)
+        self._sc_legend.set_visible(False)
+        self._single_channel_key = None
+    
     def _plot_single_channel_recording(self, result, use_continuous: bool = False):
         """Grafica el registro de canal único (corriente vs tiempo).
         
+        Si la escala, el título y la leyenda no cambian respecto al registro
+        anterior, solo se repinta la línea de datos mediante blitting.
+        
         Args:
             result: SingleChannelResult con los datos de la simulación
             use_continuous: Si True, usa la forma de onda continua (realista);
                           si False, usa la forma rectangular (ideal)
         """
-        self.plot_canvas.clear()
+        ax = self.plot_canvas.get_ax("single_channel", setup=self._setup_single_channel_axes)
         
         channel_data = result.channel_data
+        cw = result.continuous_waveform if use_continuous else None
         
-        if use_continuous and result.continuous_waveform:
-            # Graficar forma de onda continua (realista)
-            cw = result.continuous_waveform
-            self.plot_canvas.ax.plot(
-                cw.time_points,
-                cw.current_points,
-                color="coral",
-                linewidth=1.5,
-                label="Continua"
-            )
-            # Añadir leyenda con constantes de tiempo
-            self.plot_canvas.ax.legend(
-                title=f"τ_act={cw.tau_activation:.1f}ms, τ_inact={cw.tau_inactivation:.1f}ms",
-                loc="best",
-                fontsize=8
-            )
+        if cw:
+            # Forma de onda continua (realista)
+            line, other = self._cont_line, self._rect_line
+            line.set_data(*_decimate(cw.time_points, cw.current_points))
+            legend_title = f"τ_act={cw.tau_activation:.1f}ms, τ_inact={cw.tau_inactivation:.1f}ms"
         else:
-            # Graficar como step plot (rectangular/ideal)
-            if result.time_points and result.current_points:
-                self.plot_canvas.ax.plot(
-                    result.time_points,
-                    result.current_points,
-                    color="steelblue",
-                    linewidth=1.5,
-                    drawstyle="steps-post"
-                )
-        
-        # Configurar ejes
-        self.plot_canvas.ax.set_xlabel("Tiempo (ms)")
-        self.plot_canvas.ax.set_ylabel("Corriente (pA)")
+            # Step plot (rectangular/ideal)
+            line, other = self._rect_line, self._cont_line
+            line.set_data(result.time_points or [], result.current_points or [])
+            legend_title = None
+        other.set_data([], [])
+        
+        key = (
+            channel_data.ion,
+            channel_data.membrane_potential,
+            channel_data.time_range_ms,
+            channel_data.intensity,
+            use_continuous,
+            legend_title,
+        )
+        if key == self._single_channel_key and self.plot_canvas.blitting:
+            self.plot_canvas.blit_update()
+            return
+        self._single_channel_key = key
         
         waveform_label = "Continua" if use_continuous else "Rectangular"
-        self.plot_canvas.ax.set_title(
+        self._sc_title.set_text(
             f"Registro de Canal {channel_data.ion} | Vm = {channel_data.membrane_potential:.0f} mV ({waveform_label})"
         )
         
-        # Línea base en 0
-        self.plot_canvas.ax.axhline(y=0, color="gray", linestyle="--", alpha=0.5, linewidth=0.8)
+        # Leyenda con constantes de tiempo (solo forma continua)
+        if legend_title:
+            self._sc_legend.set_title(legend_title)
+        self._sc_legend.set_visible(bool(legend_title))
         
-        # Ajustar límites del eje Y
+        # Límites del eje Y según la intensidad
         if channel_data.intensity != 0:
             margin = abs(channel_data.intensity) * 0.2
             if channel_data.intensity > 0:
-                self.plot_canvas.ax.set_ylim(-margin, channel_data.intensity + margin)
+                ylim = (-margin, channel_data.intensity + margin)
             else:
-                self.plot_canvas.ax.set_ylim(channel_data.intensity - margin, margin)
+                ylim = (channel_data.intensity - margin, margin)
         else:
-            self.plot_canvas.ax.set_ylim(-10, 10)
-        
-        # Límites del eje X
-        self.plot_canvas.ax.set_xlim(0, channel_data.time_range_ms)
+            ylim = (-10, 10)
         
-        # Grid sutil
-        self.plot_canvas.ax.grid(True, alpha=0.3)
+        # Aplicar ambos límites en una sola llamada
+        ax.set(xlim=(0, channel_data.time_range_ms), ylim=ylim)
         
-        self.plot_canvas.draw()
-    
-    def _set_single_channel_example(self, ion: str, vm: str):
-        """Establece valores de ejemplo para registro de canal único."""
-        self.single_channel_form.set_value("ion", ion)
-        self.single_channel_form.set_value("membrane_potential", vm)
-        # Resetear potencial de equilibrio para usar por defecto
-        self.single_channel_form.set_value("equilibrium_potential", "")
+        # Dibujado completo que captura el fondo para los siguientes registros
+        self.plot_canvas.begin_blit([line])
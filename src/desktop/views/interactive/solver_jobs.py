@@ -0,0 +1,96 @@
+"""
+Utilidades compartidas por las vistas interactivas que ejecutan solvers.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from ...components.input_form import InputForm
+
+
+# Retardo (ms) para agrupar clics repetidos en "Calcular"
+_SUBMIT_DEBOUNCE_MS = 150
+
+# Intervalo (ms) con el que el hilo de Tk comprueba si terminó un cálculo
+_JOB_POLL_MS = 20
+
+# Máximo de textos de formulario ya convertidos a float que se recuerdan
+_FLOAT_CACHE_SIZE = 256
+
+# Conversión de superíndices a ASCII para el nombre del ion que recibe el solver
+ION_TRANSLATE = str.maketrans({"⁺": "+", "⁻": "-", "²": "2", "³": "3"})
+
+
+class SolverJobsMixin:
+    """
+    Agrupación de envíos, cálculo en segundo plano y lectura de campos
+    numéricos para vistas de Tk.
+    
+    Debe ir antes del widget de Tk en la lista de bases, para que su
+    `__init__` y su `destroy` se encadenen con los del widget.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        
+        # Cálculos pendientes (id de `after`) por formulario
+        self._pending = {}
+        
+        # Textos de formulario ya convertidos (texto -> float), FIFO acotado
+        self._float_cache = {}
+        
+        # Los solvers se ejecutan fuera del hilo de Tk (un solo trabajador)
+        self._executor = ThreadPoolExecutor(max_workers=1)
+    
+    def _debounce(self, key: str, func, data: dict):
+        """Agrupa envíos rápidos: solo se ejecuta el último tras una breve pausa."""
+        job = self._pending.get(key)
+        if job is not None:
+            self.after_cancel(job)
+        self._pending[key] = self.after(_SUBMIT_DEBOUNCE_MS, self._run_debounced, key, func, data)
+    
+    def _run_debounced(self, key: str, func, data: dict):
+        """Ejecuta un cálculo pendiente."""
+        self._pending[key] = None
+        func(data)
+    
+    def _submit_job(self, form: InputForm, func, callback):
+        """
+        Ejecuta `func` en segundo plano y entrega su Future a `callback`.
+        
+        El botón del formulario queda deshabilitado mientras dura el cálculo.
+        Tk no es seguro entre hilos, así que el resultado se recoge desde el
+        propio bucle de eventos sondeando el Future con `after`.
+        """
+        form.submit_btn.configure(state="disabled")
+        future = self._executor.submit(func)
+        self._poll_job(future, form, callback)
+    
+    def _poll_job(self, future, form: InputForm, callback):
+        """Espera (sin bloquear) a que termine un cálculo en segundo plano."""
+        if not self.winfo_exists():
+            return
+        if not future.done():
+            self.after(_JOB_POLL_MS, self._poll_job, future, form, callback)
+            return
+        form.submit_btn.configure(state="normal")
+        callback(future)
+    
+    def destroy(self):
+        """Cancela los cálculos pendientes y libera el hilo de cálculo."""
+        for job in self._pending.values():
+            if job is not None:
+                self.after_cancel(job)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+    
+    def _f(self, data: dict, key: str, default) -> float:
+        """Obtiene un campo como float, reutilizando conversiones previas."""
+        raw = data.get(key, default)
+        cache = self._float_cache
+        value = cache.get(raw)
+        if value is None:
+            value = float(raw)
+            if len(cache) >= _FLOAT_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[raw] = value
+        return value
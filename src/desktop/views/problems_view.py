@@ -3,9 +3,46 @@ Vista de problemas propuestos y seminarios.
 """
 
 import customtkinter as ctk
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import messagebox
 
 
+# Geometría de las filas de la lista de problemas (px)
+_ROW_HEIGHT = 60
+_ROW_PAD = 2
+_ROW_STRIDE = _ROW_HEIGHT + 2 * _ROW_PAD
+
+# Filas desplazadas por cada paso de la rueda del ratón
+_WHEEL_ROWS = 3
+
+# Longitud máxima del título en la lista
+_TITLE_MAX = 45
+
+# Intervalo (ms) con el que el hilo de Tk comprueba si terminó una carga
+_LOAD_POLL_MS = 30
+
+# Opciones del filtro de dificultad -> nivel (None = sin filtrar)
+_DIFFICULTY_OPTIONS = {
+    "Todas": None,
+    "1 ⭐": 1,
+    "2 ⭐⭐": 2,
+    "3 ⭐⭐⭐": 3,
+    "4 ⭐⭐⭐⭐": 4,
+    "5 ⭐⭐⭐⭐⭐": 5,
+}
+
+# Cadena de estrellas por nivel de dificultad
+_STAR_TABLE = tuple("⭐" * d for d in range(6))
+
+
+def _stars(difficulty: int) -> str:
+    """Devuelve la cadena de estrellas de un nivel de dificultad."""
+    if 0 <= difficulty < len(_STAR_TABLE):
+        return _STAR_TABLE[difficulty]
+    return "⭐" * difficulty
+
+
 class ProblemsView(ctk.CTkFrame):
     """
     Vista para el módulo de Problemas Propuestos y Seminarios.
@@ -17,9 +54,46 @@ class ProblemsView(ctk.CTkFrame):
         self.app = app
         self.current_problem = None
         
+        # Problemas cargados y columnas paralelas (texto de la fila, código
+        # de categoría, dificultad) para filtrar con máscaras en lugar de
+        # recorrer los diccionarios; las categorías se codifican como enteros
+        # para que la comparación sea numérica y no objeto a objeto. Los
+        # dicts son los del repositorio (compartidos): no se modifican
+        self._problems = []
+        self._problems_token = None
+        self._row_texts = []
+        self._cat_codes = {}
+        self._cat_arr = np.array([], dtype=np.int32)
+        self._diff_arr = np.array([], dtype=np.int8)
+        
+        # Lectura de disco fuera del hilo de Tk (los widgets se crean en él)
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        
+        # Lista virtualizada: índices de los problemas filtrados, primera
+        # fila visible y conjunto de filas reutilizables (frame, etiqueta)
+        self._shown = []
+        self._first_row = 0
+        self._row_pool = []
+        
+        # Etiqueta de eventos compartida por todos los widgets de las filas:
+        # los eventos se vinculan una sola vez a la etiqueta (bindtags)
+        self._row_tag = f"ProblemItem{id(self)}"
+        self._row_slots = {}
+        
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
         
+        self._font_title = ctk.CTkFont(size=22, weight="bold")
+        self._font_detail_title = ctk.CTkFont(size=16, weight="bold")
+        self._font_card_title = ctk.CTkFont(size=15, weight="bold")
+        self._font_order = ctk.CTkFont(size=18, weight="bold")
+        self._font_section = ctk.CTkFont(size=14, weight="bold")
+        self._font_item_title = ctk.CTkFont(size=12, weight="bold")
+        self._font_large = ctk.CTkFont(size=14)
+        self._font_placeholder = ctk.CTkFont(size=13)
+        self._font_body = ctk.CTkFont(size=12)
+        self._font_small = ctk.CTkFont(size=11)
+        
         self._create_widgets()
     
     def _create_widgets(self):
@@ -31,14 +105,14 @@ class ProblemsView(ctk.CTkFrame):
         self.title = ctk.CTkLabel(
             header_frame,
             text="📝 Problemas y Seminarios",
-            font=ctk.CTkFont(size=22, weight="bold")
+            font=self._font_title
         )
         self.title.grid(row=0, column=0, sticky="w")
         
         self.subtitle = ctk.CTkLabel(
             header_frame,
             text="Ejercicios organizados por tema y seminarios del curso",
-            font=ctk.CTkFont(size=12),
+            font=self._font_body,
             text_color="gray"
         )
         self.subtitle.grid(row=1, column=0, sticky="w")
@@ -55,9 +129,42 @@ class ProblemsView(ctk.CTkFrame):
             tab.grid_columnconfigure(0, weight=1)
             tab.grid_rowconfigure(0, weight=1)
         
-        # Crear contenido de cada tab
-        self._create_problems_tab()
-        self._create_seminars_tab()
+        # Crear contenido de cada tab al mostrarla por primera vez
+        self._tab_builders = {
+            "📋 Problemas": self._create_problems_tab,
+            "📚 Seminarios": self._create_seminars_tab,
+        }
+        self._tabs_built = set()
+        self.tabview.configure(command=self._on_tab_changed)
+        self._build_tab(self.tabview.get())
+        
+        # Al volver a la vista se recogen los problemas editados en disco
+        self.bind("<Map>", self._on_map)
+    
+    def _on_tab_changed(self):
+        """Construye una pestaña la primera vez y refresca la de problemas."""
+        name = self.tabview.get()
+        if name == "📋 Problemas" and name in self._tabs_built:
+            self._refresh_if_loaded()
+        self._build_tab(name)
+    
+    def _on_map(self, event):
+        """Refresca los problemas cuando la vista se vuelve a mostrar."""
+        if self.tabview.get() == "📋 Problemas":
+            self._refresh_if_loaded()
+    
+    def _refresh_if_loaded(self):
+        """Relee los problemas en segundo plano si ya hubo una carga."""
+        if self.app and self._problems_token is not None:
+            self._refresh_problems()
+    
+    def _build_tab(self, name: str):
+        """Construye una pestaña una sola vez (ignora nombres desconocidos)."""
+        builder = self._tab_builders.get(name)
+        if builder is None or name in self._tabs_built:
+            return
+        self._tabs_built.add(name)
+        builder()
     
     def _create_problems_tab(self):
         """Crea el contenido del tab de problemas."""
@@ -82,7 +189,7 @@ class ProblemsView(ctk.CTkFrame):
         ctk.CTkLabel(filter_frame, text="Dificultad:").grid(row=0, column=2, padx=(20, 5))
         self.difficulty_filter = ctk.CTkComboBox(
             filter_frame,
-            values=["Todas", "1 ⭐", "2 ⭐⭐", "3 ⭐⭐⭐", "4 ⭐⭐⭐⭐", "5 ⭐⭐⭐⭐⭐"],
+            values=list(_DIFFICULTY_OPTIONS),
             width=120,
             command=self._on_filter_change
         )
@@ -101,9 +208,28 @@ class ProblemsView(ctk.CTkFrame):
         self.list_frame.grid_columnconfigure(0, weight=1)
         self.list_frame.grid_rowconfigure(0, weight=1)
         
-        self.problems_scroll = ctk.CTkScrollableFrame(self.list_frame)
-        self.problems_scroll.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
-        self.problems_scroll.grid_columnconfigure(0, weight=1)
+        # Solo existen las filas visibles; al desplazarse se reconfiguran
+        self.problems_list = ctk.CTkFrame(self.list_frame, fg_color="transparent")
+        self.problems_list.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
+        self.problems_list.grid_columnconfigure(0, weight=1)
+        self.problems_list.grid_propagate(False)
+        self.problems_list.bind("<Configure>", self._on_list_resize)
+        self._bind_list_wheel(self.problems_list)
+        
+        self.problems_scrollbar = ctk.CTkScrollbar(self.list_frame, command=self._on_list_scroll)
+        self.problems_scrollbar.grid(row=0, column=1, sticky="ns", pady=5)
+        
+        self.bind_class(self._row_tag, "<Button-1>", self._on_row_click)
+        self.bind_class(self._row_tag, "<Enter>", self._on_row_enter)
+        self.bind_class(self._row_tag, "<Leave>", self._on_row_leave)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind_class(self._row_tag, sequence, self._on_list_wheel)
+        
+        self.problems_empty = ctk.CTkLabel(
+            self.problems_list,
+            text="No hay problemas disponibles",
+            text_color="gray"
+        )
         
         # Detalle del problema
         self.detail_frame = ctk.CTkFrame(self.main_paned)
@@ -114,7 +240,7 @@ class ProblemsView(ctk.CTkFrame):
         self.detail_title = ctk.CTkLabel(
             self.detail_frame,
             text="Selecciona un problema",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font_detail_title
         )
         self.detail_title.grid(row=0, column=0, sticky="w", padx=15, pady=(15, 10))
         
@@ -125,7 +251,7 @@ class ProblemsView(ctk.CTkFrame):
         self.detail_content = ctk.CTkLabel(
             self.detail_scroll,
             text="Haz clic en un problema de la lista para ver su contenido.",
-            font=ctk.CTkFont(size=13),
+            font=self._font_placeholder,
             text_color="gray",
             wraplength=400,
             justify="left"
@@ -145,7 +271,7 @@ class ProblemsView(ctk.CTkFrame):
         desc_label = ctk.CTkLabel(
             container,
             text="📖 Seminarios del curso con ejercicios y problemas propuestos",
-            font=ctk.CTkFont(size=14),
+            font=self._font_large,
             text_color="gray"
         )
         desc_label.grid(row=0, column=0, sticky="w", pady=(10, 20))
@@ -154,13 +280,20 @@ class ProblemsView(ctk.CTkFrame):
         self._load_seminars(container)
     
     def _load_seminars(self, container):
-        """Carga los seminarios desde el repositorio."""
+        """Carga los seminarios desde el repositorio (en segundo plano)."""
         if not self.app:
             self._show_empty_seminars(container)
             return
         
-        seminars = self.app.problem_repo.get_all_seminars()
-        
+        future = self._executor.submit(self.app.problem_repo.get_all_seminars)
+        self._when_loaded(
+            future,
+            lambda seminars: self._show_seminars(container, seminars),
+            lambda error: self._show_seminars_error(container, error)
+        )
+    
+    def _show_seminars(self, container, seminars):
+        """Crea las tarjetas de los seminarios ya leídos."""
         if not seminars:
             self._show_empty_seminars(container)
             return
@@ -174,12 +307,23 @@ class ProblemsView(ctk.CTkFrame):
         empty_label = ctk.CTkLabel(
             container,
             text="📂 No hay seminarios disponibles\n\nColoque archivos PDF en data/problems/seminars/\ny edite el archivo _index.json",
-            font=ctk.CTkFont(size=14),
+            font=self._font_large,
             text_color="gray",
             justify="center"
         )
         empty_label.grid(row=1, column=0, pady=50)
     
+    def _show_seminars_error(self, container, error: Exception):
+        """Muestra el error de una carga de seminarios fallida."""
+        error_label = ctk.CTkLabel(
+            container,
+            text=f"❌ Error al cargar los seminarios:\n{error}",
+            font=self._font_large,
+            text_color="gray",
+            justify="center"
+        )
+        error_label.grid(row=1, column=0, pady=50)
+    
     def _create_seminar_card(self, parent, seminar: dict) -> ctk.CTkFrame:
         """Crea una tarjeta para un seminario."""
         card = ctk.CTkFrame(parent)
@@ -194,7 +338,7 @@ class ProblemsView(ctk.CTkFrame):
         order_label = ctk.CTkLabel(
             header,
             text=f"#{seminar.get('order', '?')}",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=self._font_order,
             text_color=("blue", "lightblue"),
             width=40
         )
@@ -204,7 +348,7 @@ class ProblemsView(ctk.CTkFrame):
         title = ctk.CTkLabel(
             header,
             text=seminar.get("title", "Sin título"),
-            font=ctk.CTkFont(size=15, weight="bold"),
+            font=self._font_card_title,
             anchor="w"
         )
         title.grid(row=0, column=1, sticky="w")
@@ -214,7 +358,7 @@ class ProblemsView(ctk.CTkFrame):
             desc_label = ctk.CTkLabel(
                 card,
                 text=seminar["description"],
-                font=ctk.CTkFont(size=12),
+                font=self._font_body,
                 text_color="gray",
                 anchor="w"
             )
@@ -226,7 +370,7 @@ class ProblemsView(ctk.CTkFrame):
             topics_label = ctk.CTkLabel(
                 card,
                 text=topics_text,
-                font=ctk.CTkFont(size=11),
+                font=self._font_small,
                 text_color="gray"
             )
             topics_label.grid(row=2, column=0, sticky="w", padx=15, pady=(0, 5))
@@ -249,7 +393,7 @@ class ProblemsView(ctk.CTkFrame):
                 btn_frame,
                 text="Archivo no disponible",
                 text_color="gray",
-                font=ctk.CTkFont(size=11)
+                font=self._font_small
             )
             no_file.grid(row=0, column=0)
         
@@ -266,87 +410,244 @@ class ProblemsView(ctk.CTkFrame):
                 )
     
     def _load_problems(self):
-        """Carga los problemas desde el repositorio."""
+        """Carga los problemas desde el repositorio (en segundo plano)."""
         if not self.app:
             return
         
-        # Obtener categorías
-        categories = self.app.problem_repo.get_categories()
+        self.problems_empty.configure(text="Cargando problemas...")
+        self.problems_empty.grid(row=0, column=0, pady=20)
+        self._refresh_problems()
+    
+    def _refresh_problems(self):
+        """Relee los problemas en segundo plano si cambiaron en disco."""
+        future = self._executor.submit(self._read_problems, self._problems_token)
+        self._when_loaded(future, self._on_problems_loaded, self._on_problems_error)
+    
+    def _on_problems_loaded(self, data):
+        """Aplica los problemas leídos en segundo plano y los muestra."""
+        if not data:
+            # Sin cambios en disco: se conserva la lista (y su desplazamiento)
+            return
+        self._apply_problems(data)
+        # Los filtros pueden haber cambiado mientras se leía
+        self._show_filtered()
+    
+    def _on_problems_error(self, error: Exception):
+        """Muestra en la lista el error de una carga de problemas fallida."""
+        self._display_problems(())
+        self.problems_empty.configure(text=f"❌ Error al cargar los problemas:\n{error}")
+    
+    def _when_loaded(self, future, callback, on_error):
+        """
+        Entrega el resultado de una carga en segundo plano a `callback`.
+        
+        Tk no es seguro entre hilos, así que el Future se sondea desde el
+        propio bucle de eventos con `after`. Si la lectura falla se entrega
+        la excepción a `on_error` para mostrarla en la vista.
+        """
+        if not self.winfo_exists():
+            return
+        if not future.done():
+            self.after(_LOAD_POLL_MS, self._when_loaded, future, callback, on_error)
+            return
+        try:
+            result = future.result()
+        except Exception as e:
+            on_error(e)
+            return
+        callback(result)
+    
+    def destroy(self):
+        """Libera el hilo de carga."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+    
+    def _read_problems(self, known_token):
+        """
+        Lee problemas y categorías si cambiaron respecto a `known_token`.
+        
+        No toca widgets, por lo que puede ejecutarse en un hilo secundario.
+        
+        Returns:
+            Tupla (token, categorías, problemas, textos de las filas,
+            códigos de categoría, código por problema, dificultades) o None
+            si los datos no cambiaron
+        """
+        repo = self.app.problem_repo
+        token = repo.get_last_modified()
+        if token == known_token:
+            return None
+        
+        categories = repo.get_categories()
+        problems = repo.get_all()
+        
+        # Precalcular los textos que se muestran en cada repintado
+        row_texts = []
+        for p in problems:
+            t = p.get("title", "Sin título")
+            if len(t) > _TITLE_MAX:
+                t = t[:_TITLE_MAX] + "..."
+            row_texts.append(f"{t}\n{p.get('category', 'general')} | {_stars(p.get('difficulty', 3))}")
+        
+        cat_codes = {}
+        cat_arr = np.fromiter(
+            (cat_codes.setdefault(p.get("category"), len(cat_codes)) for p in problems),
+            dtype=np.int32,
+            count=len(problems)
+        )
+        # 0 = sin dificultad (no coincide con ningún filtro)
+        diff_arr = np.array([p.get("difficulty") or 0 for p in problems], dtype=np.int8)
+        return token, categories, problems, row_texts, cat_codes, cat_arr, diff_arr
+    
+    def _apply_problems(self, data):
+        """Guarda los problemas leídos y actualiza el filtro de categorías."""
+        (self._problems_token, categories, self._problems, self._row_texts,
+         self._cat_codes, self._cat_arr, self._diff_arr) = data
         self.category_filter.configure(values=["Todas"] + categories)
-        
-        # Cargar todos los problemas
-        self._display_problems(self.app.problem_repo.get_all())
     
-    def _display_problems(self, problems: list):
-        """Muestra la lista de problemas."""
-        # Limpiar lista actual
-        for widget in self.problems_scroll.winfo_children():
-            widget.destroy()
-        
-        if not problems:
-            empty_label = ctk.CTkLabel(
-                self.problems_scroll,
-                text="No hay problemas disponibles",
-                text_color="gray"
-            )
-            empty_label.grid(row=0, column=0, pady=20)
+    def _display_problems(self, indices):
+        """Muestra los problemas cargados con los índices dados."""
+        self._shown = indices
+        self._first_row = 0
+        
+        if not len(indices):
+            for frame, _ in self._row_pool:
+                frame.grid_remove()
+            self.problems_empty.configure(text="No hay problemas disponibles")
+            self.problems_empty.grid(row=0, column=0, pady=20)
+            self.problems_scrollbar.set(0, 1)
             return
         
-        for i, problem in enumerate(problems):
-            item = self._create_problem_item(problem)
-            item.grid(row=i, column=0, sticky="ew", pady=2)
+        self.problems_empty.grid_remove()
+        self._refresh_rows()
+    
+    def _visible_slots(self) -> int:
+        """Número de filas que caben en el área visible de la lista."""
+        return max(1, self.problems_list.winfo_height() // _ROW_STRIDE)
+    
+    def _refresh_rows(self):
+        """Asigna a cada fila del pool el problema que le toca mostrar."""
+        total = len(self._shown)
+        if not total:
+            return
+        slots = self._visible_slots()
+        self._first_row = max(0, min(self._first_row, total - slots))
+        
+        while len(self._row_pool) < min(slots, total):
+            self._row_pool.append(self._create_problem_item(len(self._row_pool)))
+        
+        # Cada fila ocupa siempre la misma celda: solo se toca el gestor de
+        # geometría al mostrarla u ocultarla, no en cada desplazamiento
+        for slot, row in enumerate(self._row_pool):
+            index = self._first_row + slot
+            if slot < slots and index < total:
+                self._update_problem_item(row, self._row_texts[self._shown[index]])
+                if not row[0].winfo_manager():
+                    row[0].grid(row=slot, column=0, sticky="ew", pady=_ROW_PAD)
+            elif row[0].winfo_manager():
+                row[0].grid_remove()
+        
+        self.problems_scrollbar.set(self._first_row / total, min(1.0, (self._first_row + slots) / total))
+    
+    def _scroll_to(self, first_row: int):
+        """Desplaza la lista para que `first_row` sea la primera visible."""
+        first_row = max(0, min(first_row, len(self._shown) - self._visible_slots()))
+        if first_row != self._first_row:
+            self._first_row = first_row
+            self._refresh_rows()
     
-    def _create_problem_item(self, problem: dict):
-        """Crea un item de problema para la lista."""
+    def _on_list_scroll(self, action: str, amount, unit: str = "units"):
+        """Maneja los comandos de la barra de desplazamiento."""
+        if action == "moveto":
+            self._scroll_to(round(float(amount) * len(self._shown)))
+        elif action == "scroll":
+            step = self._visible_slots() if unit == "pages" else 1
+            self._scroll_to(self._first_row + int(amount) * step)
+    
+    def _on_list_wheel(self, event):
+        """Desplaza la lista con la rueda del ratón."""
+        direction = -1 if event.num == 4 or event.delta > 0 else 1
+        self._scroll_to(self._first_row + direction * _WHEEL_ROWS)
+    
+    def _on_list_resize(self, event=None):
+        """Recalcula las filas visibles al cambiar el tamaño de la lista."""
+        if len(self._shown):
+            self._refresh_rows()
+    
+    def _bind_list_wheel(self, widget):
+        """Vincula la rueda del ratón (Windows/macOS y X11) a la lista."""
+        widget.bind("<MouseWheel>", self._on_list_wheel)
+        widget.bind("<Button-4>", self._on_list_wheel)
+        widget.bind("<Button-5>", self._on_list_wheel)
+    
+    def _create_problem_item(self, slot: int) -> tuple:
+        """Crea una fila reutilizable de la lista de problemas."""
         frame = ctk.CTkFrame(
-            self.problems_scroll,
+            self.problems_list,
             fg_color=("gray85", "gray25"),
             corner_radius=5,
-            height=60,
+            height=_ROW_HEIGHT,
             cursor="hand2"
         )
         frame.grid_columnconfigure(0, weight=1)
+        frame.grid_rowconfigure(0, weight=1)
+        # Altura fija: la lista virtualizada asume un paso de fila constante
         frame.grid_propagate(False)
         
-        # Título
-        title = ctk.CTkLabel(
+        # Título e info en una sola etiqueta de dos líneas
+        label = ctk.CTkLabel(
             frame,
-            text=problem.get("title", "Sin título")[:45] + ("..." if len(problem.get("title", "")) > 45 else ""),
-            font=ctk.CTkFont(size=12, weight="bold"),
+            text="",
+            font=self._font_item_title,
+            justify="left",
             anchor="w"
         )
-        title.grid(row=0, column=0, sticky="w", padx=10, pady=(8, 0))
-        
-        # Info
-        difficulty = problem.get("difficulty", 3)
-        stars = "⭐" * difficulty
-        category = problem.get("category", "general")
-        
-        info = ctk.CTkLabel(
-            frame,
-            text=f"{category} | {stars}",
-            font=ctk.CTkFont(size=10),
-            text_color="gray"
-        )
-        info.grid(row=1, column=0, sticky="w", padx=10, pady=(0, 8))
-        
-        # Hacer todo el frame clicable
-        def on_click(event):
-            self._show_problem_detail(problem)
-        
-        def on_enter(event):
-            frame.configure(fg_color=("gray75", "gray35"))
-        
-        def on_leave(event):
-            frame.configure(fg_color=("gray85", "gray25"))
-        
-        # Vincular eventos a todos los widgets
-        for widget in [frame, title, info]:
-            widget.bind("<Button-1>", on_click)
-            widget.bind("<Enter>", on_enter)
-            widget.bind("<Leave>", on_leave)
-        
-        return frame
+        label.grid(row=0, column=0, sticky="ew", padx=10)
+        
+        # Hacer toda la fila clicable: los widgets de CustomTkinter son
+        # compuestos, así que la etiqueta se añade a todos los widgets Tk
+        self._row_slots[frame] = slot
+        pending = [frame]
+        while pending:
+            widget = pending.pop()
+            widget.bindtags(widget.bindtags() + (self._row_tag,))
+            pending.extend(widget.winfo_children())
+        
+        return frame, label
+    
+    def _update_problem_item(self, row: tuple, text: str):
+        """Muestra el texto de un problema en una fila existente."""
+        row[1].configure(text=text)
+    
+    def _row_slot(self, widget):
+        """Devuelve la posición en el pool de la fila que contiene `widget`."""
+        while widget is not None:
+            slot = self._row_slots.get(widget)
+            if slot is not None:
+                return slot
+            widget = widget.master
+        return None
+    
+    def _on_row_click(self, event):
+        """Muestra el problema que ocupa actualmente la fila pulsada."""
+        slot = self._row_slot(event.widget)
+        if slot is None:
+            return
+        index = self._first_row + slot
+        if index < len(self._shown):
+            self._show_problem_detail(self._problems[self._shown[index]])
+    
+    def _on_row_enter(self, event):
+        """Resalta la fila bajo el cursor."""
+        slot = self._row_slot(event.widget)
+        if slot is not None:
+            self._row_pool[slot][0].configure(fg_color=("gray75", "gray35"))
+    
+    def _on_row_leave(self, event):
+        """Quita el resaltado de la fila."""
+        slot = self._row_slot(event.widget)
+        if slot is not None:
+            self._row_pool[slot][0].configure(fg_color=("gray85", "gray25"))
     
     def _show_problem_detail(self, problem: dict):
         """Muestra el detalle de un problema."""
@@ -365,15 +666,14 @@ class ProblemsView(ctk.CTkFrame):
         meta_frame = ctk.CTkFrame(self.detail_scroll, fg_color=("gray90", "gray20"))
         meta_frame.grid(row=row, column=0, sticky="ew", pady=(0, 15))
         
-        difficulty = problem.get("difficulty", 3)
-        meta_text = f"Dificultad: {'⭐' * difficulty} | Categoría: {problem.get('category', 'N/A')}"
+        meta_text = f"Dificultad: {_stars(problem.get('difficulty', 3))} | Categoría: {problem.get('category', 'N/A')}"
         if problem.get("tags"):
             meta_text += f" | Tags: {', '.join(problem['tags'][:3])}"
         
         meta_label = ctk.CTkLabel(
             meta_frame,
             text=meta_text,
-            font=ctk.CTkFont(size=11)
+            font=self._font_small
         )
         meta_label.grid(row=0, column=0, padx=10, pady=8)
         row += 1
@@ -382,7 +682,7 @@ class ProblemsView(ctk.CTkFrame):
         statement_label = ctk.CTkLabel(
             self.detail_scroll,
             text="📋 Enunciado:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._font_section
         )
         statement_label.grid(row=row, column=0, sticky="w", pady=(10, 5))
         row += 1
@@ -390,7 +690,7 @@ class ProblemsView(ctk.CTkFrame):
         statement = ctk.CTkLabel(
             self.detail_scroll,
             text=problem.get("statement", "No disponible"),
-            font=ctk.CTkFont(size=12),
+            font=self._font_body,
             wraplength=450,
             justify="left"
         )
@@ -402,24 +702,28 @@ class ProblemsView(ctk.CTkFrame):
             data_label = ctk.CTkLabel(
                 self.detail_scroll,
                 text="📊 Datos proporcionados:",
-                font=ctk.CTkFont(size=14, weight="bold")
+                font=self._font_section
             )
             data_label.grid(row=row, column=0, sticky="w", pady=(10, 5))
             row += 1
             
+            # Un único label multilínea en lugar de uno por dato
+            lines = []
             for key, value in problem["given_data"].items():
                 if isinstance(value, dict):
-                    text = f"• {key}: {value.get('value', '')} {value.get('unit', '')}"
+                    lines.append(f"• {key}: {value.get('value', '')} {value.get('unit', '')}")
                 else:
-                    text = f"• {key}: {value}"
-                
-                data_item = ctk.CTkLabel(
-                    self.detail_scroll,
-                    text=text,
-                    font=ctk.CTkFont(size=11)
-                )
-                data_item.grid(row=row, column=0, sticky="w", padx=15)
-                row += 1
+                    lines.append(f"• {key}: {value}")
+            
+            data_items = ctk.CTkLabel(
+                self.detail_scroll,
+                text="\n".join(lines),
+                font=self._font_small,
+                justify="left",
+                anchor="w"
+            )
+            data_items.grid(row=row, column=0, sticky="w", padx=15)
+            row += 1
         
         # Botón de mostrar solución
         if problem.get("solution"):
@@ -447,21 +751,21 @@ class ProblemsView(ctk.CTkFrame):
         
         # Por simplicidad, mostramos en un mensaje
         if solution:
-            steps_text = ""
+            parts = []
             for step in solution.get("steps", []):
-                steps_text += f"\nPaso {step['step_number']}: {step['description']}\n"
+                parts.append(f"\nPaso {step['step_number']}: {step['description']}\n")
                 if step.get("formula"):
-                    steps_text += f"   Fórmula: {step['formula']}\n"
+                    parts.append(f"   Fórmula: {step['formula']}\n")
                 if step.get("calculation"):
-                    steps_text += f"   Cálculo: {step['calculation']}\n"
+                    parts.append(f"   Cálculo: {step['calculation']}\n")
             
             final = solution.get("final_answer", {})
-            final_text = f"\n\n✅ Respuesta: {final.get('value', '')} {final.get('unit', '')}"
+            parts.append(f"\n\n✅ Respuesta: {final.get('value', '')} {final.get('unit', '')}")
             
             if solution.get("interpretation"):
-                final_text += f"\n\n💡 {solution['interpretation']}"
+                parts.append(f"\n\n💡 {solution['interpretation']}")
             
-            messagebox.showinfo("Solución", steps_text + final_text)
+            messagebox.showinfo("Solución", "".join(parts))
     
     def _open_in_solver(self, problem: dict):
         """Abre el problema en el solver correspondiente."""
@@ -475,21 +779,27 @@ class ProblemsView(ctk.CTkFrame):
             self.app.show_view("patch_clamp")
     
     def _on_filter_change(self, *args):
-        """Maneja cambios en los filtros."""
-        if not self.app:
-            return
+        """Maneja cambios en los filtros (sobre los datos ya cargados)."""
+        self._show_filtered()
+    
+    def _show_filtered(self):
+        """Muestra los problemas que cumplen los filtros actuales."""
+        problems = self._problems
+        category = self.category_filter.get()
+        # Texto desconocido (el combo es editable) = sin filtro de dificultad
+        difficulty = _DIFFICULTY_OPTIONS.get(self.difficulty_filter.get())
         
-        problems = self.app.problem_repo.get_all()
+        # Sin filtros activos se muestra la lista cargada tal cual
+        if category == "Todas" and difficulty is None:
+            self._display_problems(range(len(problems)))
+            return
         
-        # Filtrar por categoría
-        category = self.category_filter.get()
+        # Una sola máscara combinada para ambos filtros
+        mask = np.ones(len(problems), dtype=bool)
         if category != "Todas":
-            problems = [p for p in problems if p.get("category") == category]
-        
-        # Filtrar por dificultad
-        difficulty = self.difficulty_filter.get()
-        if difficulty != "Todas":
-            diff_num = int(difficulty[0])
-            problems = [p for p in problems if p.get("difficulty") == diff_num]
+            # -1 = categoría sin problemas (ningún código coincide)
+            mask &= self._cat_arr == self._cat_codes.get(category, -1)
+        if difficulty is not None:
+            mask &= self._diff_arr == difficulty
         
-        self._display_problems(problems)
+        self._display_problems(np.flatnonzero(mask))
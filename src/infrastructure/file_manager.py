@@ -9,6 +9,18 @@ from pathlib import Path
 from typing import Optional, List
 
 
+def _scan_pdfs(directory: str) -> List[Path]:
+    """Busca recursivamente los PDFs de un directorio con os.scandir."""
+    pdfs = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                pdfs.extend(_scan_pdfs(entry.path))
+            elif entry.name.endswith(".pdf"):
+                pdfs.append(Path(entry.path))
+    return pdfs
+
+
 class FileManager:
     """
     Gestor de archivos para operaciones comunes.
@@ -120,7 +132,7 @@ class FileManager:
         if not dir_path.exists():
             return []
         
-        return list(dir_path.glob("**/*.pdf"))
+        return _scan_pdfs(str(dir_path))
     
     def get_pdf_info(self, relative_path: str) -> Optional[dict]:
         """
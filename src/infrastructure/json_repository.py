@@ -3,11 +3,38 @@ Repositorio basado en archivos JSON.
 """
 
 import json
+import os
+import threading
+import time
+import zlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Type, TypeVar
-from pydantic import BaseModel
+from typing import TYPE_CHECKING, Iterable, List, Dict, Any, Optional, Tuple, Type, TypeVar
 
-T = TypeVar('T', bound=BaseModel)
+# pydantic solo se usa en anotaciones: los helpers de modelos no lo necesitan
+# en tiempo de ejecución y así importar el repositorio no lo carga
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+# orjson (opcional) parsea y serializa bastante más rápido que json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+T = TypeVar('T', bound='BaseModel')
+
+# A partir de cuántos archivos se leen en paralelo (con pocos, el coste de
+# crear los hilos supera lo que se gana solapando la E/S)
+_PARALLEL_READ_MIN = 32
+
+# Hilos máximos para leer archivos en paralelo
+_READ_WORKERS = 8
+
+# Segundos durante los que una caché recién validada se da por buena sin
+# volver a recorrer el disco (agrupa consultas seguidas de la interfaz)
+_REVALIDATE_S = 1.0
 
 
 class JsonRepository:
@@ -26,24 +53,117 @@ class JsonRepository:
             data_dir: Directorio base de datos
         """
         self.data_dir = Path(data_dir)
-        self.data_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Directorios ya creados o comprobados por este repositorio; si se
+        # borran después, _write_json los vuelve a crear
+        self._ensured = set()
+        self._ensure_dir(self.data_dir)
+        
+        # Archivos ya parseados: ruta -> ((mtime_ns, tamaño), datos)
+        self._json_cache = {}
+    
+    def _ensure_dir(self, directory: Path) -> None:
+        """Crea un directorio si hace falta (solo se comprueba una vez)."""
+        if directory not in self._ensured:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._ensured.add(directory)
+    
+    @staticmethod
+    def _mtime(filepath: Path) -> Optional[int]:
+        """Fecha de modificación (ns) de un archivo, o None si no existe."""
+        try:
+            return filepath.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
     
     def _read_json(self, filepath: Path) -> Any:
-        """Lee un archivo JSON."""
-        if not filepath.exists():
+        """
+        Lee un archivo JSON (None si no existe).
+        
+        El resultado se reutiliza mientras no cambien la fecha de
+        modificación ni el tamaño del archivo, así que el objeto devuelto
+        es compartido: solo debe modificarse de forma idempotente (p. ej.
+        añadir local_path).
+        """
+        try:
+            st = filepath.stat()
+        except FileNotFoundError:
+            self._json_cache.pop(filepath, None)
+            return None
+        
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._json_cache.get(filepath)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        try:
+            if orjson is not None:
+                data = orjson.loads(filepath.read_bytes())
+            else:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+        except FileNotFoundError:
             return None
         
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        self._json_cache[filepath] = (stamp, data)
+        return data
+    
+    def _write_json(self, filepath: Path, data: Any, compact: bool = False) -> None:
+        """
+        Escribe datos a un archivo JSON.
+        
+        El contenido se serializa entero en memoria, se escribe en un archivo
+        temporal junto al destino y se sustituye con os.replace: una
+        interrupción nunca deja el archivo a medias.
+        
+        Args:
+            filepath: Archivo de destino
+            data: Datos a serializar
+            compact: Sin sangría ni espacios; para archivos que solo lee la
+                aplicación (menos bytes que leer y parsear)
+        """
+        if orjson is not None:
+            # orjson siempre escribe UTF-8 sin escapar (como ensure_ascii=False)
+            option = orjson.OPT_NON_STR_KEYS
+            if not compact:
+                option |= orjson.OPT_INDENT_2
+            payload = orjson.dumps(data, option=option)
+        elif compact:
+            payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        else:
+            payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        
+        self._write_bytes(filepath, payload)
     
-    def _write_json(self, filepath: Path, data: Any) -> None:
-        """Escribe datos a un archivo JSON."""
-        filepath.parent.mkdir(parents=True, exist_ok=True)
+    def _write_bytes(self, filepath: Path, payload: bytes) -> None:
+        """
+        Escribe un archivo de forma atómica.
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        Se escribe en un archivo temporal junto al destino, se fuerza a
+        disco y se sustituye con os.replace.
+        """
+        self._ensure_dir(filepath.parent)
+        self._json_cache.pop(filepath, None)
+        
+        tmp_path = filepath.with_name(filepath.name + ".tmp")
+        # O_BINARY evita la traducción de saltos de línea en Windows
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        try:
+            fd = os.open(tmp_path, flags, 0o644)
+        except FileNotFoundError:
+            # El directorio se borró después de comprobarlo: recrearlo
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(tmp_path, flags, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, filepath)
     
-    def _model_to_dict(self, model: BaseModel) -> Dict:
+    def _model_to_dict(self, model: 'BaseModel') -> Dict:
         """Convierte un modelo Pydantic a diccionario."""
         return model.model_dump()
     
@@ -59,6 +179,34 @@ class ConferenceRepository(JsonRepository):
         super().__init__(data_dir)
         self.conferences_dir = self.data_dir / "conferences"
         self.index_file = self.conferences_dir / "_index.json"
+        
+        # Conferencias ya aplanadas, fecha de modificación del índice con
+        # la que se leyeron e índices por id y por tema
+        self._conferences = None
+        self._index_mtime = None
+        self._by_id = {}
+        self._by_topic = {}
+        self._topics = []
+    
+    def _refresh_cache(self) -> None:
+        """Relee el índice y reconstruye los índices si cambió en disco."""
+        mtime = self._mtime(self.index_file)
+        if self._conferences is not None and mtime == self._index_mtime:
+            return
+        
+        conferences = self._load_conferences()
+        by_id = {}
+        by_topic = {}
+        for conf in conferences:
+            # Ante ids repetidos gana el primero, como en la búsqueda lineal
+            by_id.setdefault(conf["id"], conf)
+            by_topic.setdefault(conf["topic"], []).append(conf)
+        
+        self._conferences = conferences
+        self._index_mtime = mtime
+        self._by_id = by_id
+        self._by_topic = by_topic
+        self._topics = sorted(by_topic)
     
     def get_all(self) -> List[Dict]:
         """
@@ -67,6 +215,11 @@ class ConferenceRepository(JsonRepository):
         Transforma la estructura de topics con files en una lista
         plana de conferencias con local_path construido.
         """
+        self._refresh_cache()
+        return list(self._conferences)
+    
+    def _load_conferences(self) -> List[Dict]:
+        """Lee el índice y lo aplana en una lista de conferencias."""
         data = self._read_json(self.index_file)
         if not data:
             return []
@@ -104,15 +257,13 @@ class ConferenceRepository(JsonRepository):
     
     def get_by_topic(self, topic: str) -> List[Dict]:
         """Obtiene conferencias por tema."""
-        all_confs = self.get_all()
-        return [c for c in all_confs if c.get("topic") == topic]
+        self._refresh_cache()
+        return list(self._by_topic.get(topic, []))
     
     def get_by_id(self, conf_id: str) -> Optional[Dict]:
         """Obtiene una conferencia por ID."""
-        for conf in self.get_all():
-            if conf.get("id") == conf_id:
-                return conf
-        return None
+        self._refresh_cache()
+        return self._by_id.get(conf_id)
     
     def save(self, conference: Dict) -> None:
         """Guarda o actualiza una conferencia."""
@@ -122,9 +273,8 @@ class ConferenceRepository(JsonRepository):
     
     def get_topics(self) -> List[str]:
         """Obtiene la lista de temas únicos."""
-        conferences = self.get_all()
-        topics = set(c.get("topic", "") for c in conferences)
-        return sorted(topics)
+        self._refresh_cache()
+        return list(self._topics)
 
 
 class BibliographyRepository(JsonRepository):
@@ -136,6 +286,11 @@ class BibliographyRepository(JsonRepository):
         self.books_file = self.biblio_dir / "books.json"
         self.papers_file = self.biblio_dir / "papers.json"
         self.index_file = self.biblio_dir / "index.json"
+        
+        # Secciones ya leídas: clave -> {"stamp", "items", "positions",
+        # "by_topic", "primary"} (marcas de modificación, items, posición de
+        # cada id, items por tema y referencias principales)
+        self._cache = {}
     
     def _add_local_path(self, item: Dict) -> Dict:
         """Añade local_path a un item basándose en su filename."""
@@ -143,75 +298,119 @@ class BibliographyRepository(JsonRepository):
             item["local_path"] = f"bibliography/pdfs/{item['filename']}"
         return item
     
-    def get_all_books(self) -> List[Dict]:
-        """Obtiene todos los libros."""
+    def _load_section(self, key: str, fallback_file: Path) -> Dict[str, Any]:
+        """
+        Carga una sección ("books" o "papers") de la bibliografía.
+        
+        Se lee de index.json o, si no la contiene, de su archivo propio.
+        El resultado (con local_path ya añadido) se reutiliza mientras no
+        cambie la fecha de modificación de ninguno de los dos archivos.
+        
+        Returns:
+            Entrada de caché de la sección (ver `_cache`)
+        """
+        stamp = (self._mtime(self.index_file), self._mtime(fallback_file))
+        cached = self._cache.get(key)
+        if cached is not None and cached["stamp"] == stamp:
+            return cached
+        
+        items = []
+        
         # Intentar primero con index.json
         data = self._read_json(self.index_file)
-        if data and "books" in data:
-            books = data.get("books", [])
-            return [self._add_local_path(book.copy()) for book in books]
-        
-        # Fallback a books.json
-        data = self._read_json(self.books_file)
+        if not (data and key in data):
+            # Fallback al archivo de la sección
+            data = self._read_json(fallback_file)
         if data:
-            books = data.get("books", [])
-            return [self._add_local_path(book.copy()) for book in books]
+            # Los dicts acaban de parsearse: se completan en el sitio sin copiarlos
+            items = [self._add_local_path(item) for item in data.get(key, [])]
         
-        return []
+        positions = {}
+        by_topic = defaultdict(list)
+        primary = []
+        for i, item in enumerate(items):
+            # Ante ids repetidos gana el primero, como en la búsqueda lineal
+            positions.setdefault(item.get("id"), i)
+            # Un item con un tema repetido aparece una sola vez en ese tema
+            for topic in dict.fromkeys(item.get("topics", [])):
+                by_topic[topic].append(item)
+            if item.get("is_primary", False):
+                primary.append(item)
+        
+        self._cache[key] = {
+            "stamp": stamp,
+            "items": items,
+            "positions": positions,
+            "by_topic": dict(by_topic),
+            "primary": primary,
+        }
+        return self._cache[key]
+    
+    def _sections(self):
+        """Secciones cargadas en orden: primero libros, luego artículos."""
+        return (
+            self._load_section("books", self.books_file),
+            self._load_section("papers", self.papers_file),
+        )
+    
+    def get_all_books(self) -> List[Dict]:
+        """Obtiene todos los libros."""
+        return list(self._load_section("books", self.books_file)["items"])
     
     def get_all_papers(self) -> List[Dict]:
         """Obtiene todos los artículos."""
-        # Intentar primero con index.json
-        data = self._read_json(self.index_file)
-        if data and "papers" in data:
-            papers = data.get("papers", [])
-            return [self._add_local_path(paper.copy()) for paper in papers]
-        
-        # Fallback a papers.json
-        data = self._read_json(self.papers_file)
-        if data:
-            papers = data.get("papers", [])
-            return [self._add_local_path(paper.copy()) for paper in papers]
-        
-        return []
+        return list(self._load_section("papers", self.papers_file)["items"])
     
     def get_all(self) -> List[Dict]:
         """Obtiene toda la bibliografía."""
-        return self.get_all_books() + self.get_all_papers()
+        return [item for section in self._sections() for item in section["items"]]
     
     def get_by_id(self, item_id: str) -> Optional[Dict]:
         """Obtiene un item bibliográfico por ID."""
-        for item in self.get_all():
-            if item.get("id") == item_id:
-                return item
+        for section in self._sections():
+            i = section["positions"].get(item_id)
+            if i is not None:
+                return section["items"][i]
         return None
     
     def get_by_topic(self, topic: str) -> List[Dict]:
         """Obtiene bibliografía por tema."""
         return [
-            item for item in self.get_all()
-            if topic in item.get("topics", [])
+            item
+            for section in self._sections()
+            for item in section["by_topic"].get(topic, [])
         ]
     
     def save_book(self, book: Dict) -> None:
         """Guarda o actualiza un libro."""
-        books = self.get_all_books()
+        self.save_books([book])
+    
+    def save_books(self, new_books: Iterable[Dict]) -> None:
+        """
+        Guarda o actualiza varios libros con una sola lectura y escritura.
         
-        found = False
-        for i, b in enumerate(books):
-            if b.get("id") == book.get("id"):
-                books[i] = book
-                found = True
-                break
+        Los libros con un id ya existente lo sustituyen en su posición; el
+        resto se añaden al final en el orden recibido.
+        """
+        section = self._load_section("books", self.books_file)
+        books = list(section["items"])
+        positions = dict(section["positions"])
         
-        if not found:
-            books.append(book)
+        for book in new_books:
+            book_id = book.get("id")
+            i = positions.get(book_id)
+            if i is not None:
+                books[i] = book
+            else:
+                positions[book_id] = len(books)
+                books.append(book)
         
         self._write_json(self.books_file, {"books": books})
+        self._cache.pop("books", None)
     
     def get_primary_references(self) -> List[Dict]:
         """Obtiene las referencias principales del curso."""
-        return [item for item in self.get_all() if item.get("is_primary", False)]
+        return [item for section in self._sections() for item in section["primary"]]
 
 
 class ProblemRepository(JsonRepository):
@@ -221,20 +420,176 @@ class ProblemRepository(JsonRepository):
         super().__init__(data_dir)
         self.problems_dir = self.data_dir / "problems"
         self.seminars_index = self.problems_dir / "seminars" / "_index.json"
+        # Copia agregada de todos los problemas (una sola lectura al arrancar);
+        # los archivos por problema siguen siendo la fuente de verdad
+        self.problems_index = self.problems_dir / "_index.json"
+        # Marca con la que se generó el índice, aparte para poder descartar
+        # un índice obsoleto sin parsearlo
+        self.problems_index_token = self.problems_dir / "_index.token"
+        
+        # Problemas ya parseados, marca de modificación con la que se
+        # leyeron, categorías e índices por id, categoría, dificultad y solver
+        self._problems_cache = None
+        self._problems_token = None
+        self._entries = []
+        self._categories = []
+        self._by_id = {}
+        self._id_to_path = {}
+        self._by_category = {}
+        self._by_difficulty = {}
+        self._by_solver = {}
+        
+        # Última marca calculada recorriendo el disco y cuándo (monotonic)
+        self._seen_token = None
+        self._seen_at = float("-inf")
+        
+        # La vista de problemas consulta desde un hilo secundario y otras
+        # partes desde el de Tk: la reconstrucción de la caché se serializa
+        self._lock = threading.Lock()
     
-    def get_all(self) -> List[Dict]:
-        """Obtiene todos los problemas."""
-        problems = []
+    def _refresh_cache(self) -> None:
+        """
+        Relee los problemas y reconstruye los índices si cambiaron en disco.
+        
+        Los archivos solo se vuelven a leer si cambió la marca de
+        `get_last_modified`; si no, se conservan los datos en memoria. Una
+        marca calculada hace menos de `_REVALIDATE_S` (por esta consulta o
+        por una llamada a `get_last_modified`) se reutiliza sin volver a
+        recorrer el disco; guardar desde el repositorio la descarta.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now - self._seen_at < _REVALIDATE_S:
+                token = self._seen_token
+            else:
+                token = self._scan_token()
+                self._seen_token, self._seen_at = token, now
+            if self._problems_cache is not None and token == self._problems_token:
+                return
+            
+            problems = []
+            by_id = {}
+            id_to_path = {}
+            by_category = defaultdict(list)
+            by_difficulty = defaultdict(list)
+            by_solver = defaultdict(list)
+            
+            categories, entries = self._load_entries(token)
+            for category, problem_file, data in entries:
+                problems.append(data)
+                # Ante ids repetidos gana el primero, como en la búsqueda lineal
+                problem_id = data.get("id")
+                if problem_id not in by_id:
+                    by_id[problem_id] = data
+                    id_to_path[problem_id] = problem_file
+                by_category[category].append(data)
+                by_difficulty[data.get("difficulty")].append(data)
+                by_solver[data.get("related_solver")].append(data)
+            
+            self._problems_cache = problems
+            self._problems_token = token
+            self._entries = entries
+            self._categories = sorted(categories)
+            self._by_id = by_id
+            self._id_to_path = id_to_path
+            self._by_category = dict(by_category)
+            self._by_difficulty = dict(by_difficulty)
+            self._by_solver = dict(by_solver)
+    
+    def _load_entries(self, token: int) -> Tuple[List[str], List[Tuple[str, Path, Dict]]]:
+        """
+        Obtiene categorías y problemas, del índice agregado si está al día.
         
-        for category_dir in self.problems_dir.iterdir():
-            if category_dir.is_dir() and not category_dir.name.startswith("_"):
-                for problem_file in category_dir.glob("*.json"):
-                    if not problem_file.name.startswith("_"):
-                        data = self._read_json(problem_file)
-                        if data:
-                            problems.append(data)
+        El índice solo se usa si se generó con la misma marca de
+        modificación; si no, se leen los archivos de cada problema y se
+        regenera el índice para el siguiente arranque.
         
-        return problems
+        Returns:
+            Tupla (categorías, lista de (categoría, archivo, problema))
+        """
+        # La marca se guarda como texto: puede superar los 64 bits de JSON
+        if self._index_token() == str(token):
+            index = self._read_json(self.problems_index)
+            if index and index.get("token") == str(token):
+                entries = []
+                for item in index.get("problems", []):
+                    relative = Path(item["path"])
+                    entries.append((relative.parts[0], self.problems_dir / relative, item["data"]))
+                return index.get("categories", []), entries
+        
+        categories, problem_files = self._problem_files()
+        paths = [path for _, path in problem_files]
+        if len(paths) >= _PARALLEL_READ_MIN:
+            # La lectura libera el GIL: solapar muchas lecturas pequeñas
+            with ThreadPoolExecutor(max_workers=_READ_WORKERS) as pool:
+                parsed = list(pool.map(self._read_json, paths))
+        else:
+            parsed = [self._read_json(path) for path in paths]
+        
+        entries = [
+            (category, path, data)
+            for (category, path), data in zip(problem_files, parsed)
+            if data
+        ]
+        self._write_index(token, categories, entries)
+        return categories, entries
+    
+    def _index_token(self) -> Optional[str]:
+        """Marca con la que se generó el índice agregado (None si no hay)."""
+        try:
+            return self.problems_index_token.read_text(encoding="utf-8").strip()
+        except (FileNotFoundError, UnicodeDecodeError):
+            return None
+    
+    def _write_index(self, token: int, categories: List[str], entries: List[Tuple[str, Path, Dict]]) -> None:
+        """
+        Guarda el índice agregado y después su marca.
+        
+        La marca se escribe la última: si algo falla entre medias queda la
+        anterior, que no coincide, y el índice no se usa. Si la carpeta no
+        admite escritura, se sigue sin índice.
+        """
+        problems = [
+            {"path": path.relative_to(self.problems_dir).as_posix(), "data": data}
+            for _, path, data in entries
+        ]
+        try:
+            self._write_json(self.problems_index, {
+                "token": str(token),
+                "categories": categories,
+                "problems": problems,
+            }, compact=True)
+            self._write_bytes(self.problems_index_token, str(token).encode("utf-8"))
+        except OSError:
+            pass
+    
+    def _problem_files(self) -> Tuple[List[str], List[Tuple[str, Path]]]:
+        """
+        Recorre las carpetas de problemas con os.scandir.
+        
+        Se ignoran las carpetas y archivos que empiezan por "_".
+        
+        Returns:
+            Tupla (categorías, lista de (categoría, archivo)); las categorías
+            incluyen las carpetas vacías
+        """
+        names = []
+        files = []
+        with os.scandir(self.problems_dir) as categories:
+            for category in categories:
+                if not category.is_dir() or category.name.startswith("_"):
+                    continue
+                names.append(category.name)
+                with os.scandir(category.path) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".json") and not entry.name.startswith("_"):
+                            files.append((category.name, Path(entry.path)))
+        return names, files
+    
+    def get_all(self) -> List[Dict]:
+        """Obtiene todos los problemas."""
+        self._refresh_cache()
+        return list(self._problems_cache)
     
     def get_all_seminars(self) -> List[Dict]:
         """Obtiene todos los seminarios con sus rutas locales."""
@@ -242,65 +597,112 @@ class ProblemRepository(JsonRepository):
         if not data:
             return []
         
-        seminars = []
-        for seminar in data.get("seminars", []):
-            sem = seminar.copy()
-            filename = sem.get("filename", "")
+        # Los dicts acaban de parsearse: se completan en el sitio sin copiarlos
+        seminars = data.get("seminars", [])
+        for seminar in seminars:
+            filename = seminar.get("filename", "")
             if filename:
-                sem["local_path"] = f"problems/seminars/{filename}"
-            seminars.append(sem)
+                seminar["local_path"] = f"problems/seminars/{filename}"
         
         return sorted(seminars, key=lambda x: x.get("order", 0))
     
     def get_by_category(self, category: str) -> List[Dict]:
-        """Obtiene problemas por categoría."""
-        category_dir = self.problems_dir / category
-        problems = []
-        
-        if category_dir.exists():
-            for problem_file in category_dir.glob("*.json"):
-                if not problem_file.name.startswith("_"):
-                    data = self._read_json(problem_file)
-                    if data:
-                        problems.append(data)
-        
-        return problems
+        """Obtiene problemas por categoría (directorio)."""
+        self._refresh_cache()
+        return list(self._by_category.get(category, []))
     
     def get_by_id(self, problem_id: str) -> Optional[Dict]:
-        """Obtiene un problema por ID."""
-        for problem in self.get_all():
-            if problem.get("id") == problem_id:
-                return problem
-        return None
+        """
+        Obtiene un problema por ID.
+        
+        Si ya se conoce el archivo del problema se lee solo ese (una
+        consulta de fecha si no cambió); si no coincide, se refresca todo.
+        """
+        path = self._id_to_path.get(problem_id)
+        if path is not None:
+            data = self._read_json(path)
+            if data and data.get("id") == problem_id:
+                return data
+        
+        self._refresh_cache()
+        return self._by_id.get(problem_id)
     
     def get_by_difficulty(self, difficulty: int) -> List[Dict]:
         """Obtiene problemas por nivel de dificultad."""
-        return [p for p in self.get_all() if p.get("difficulty") == difficulty]
+        self._refresh_cache()
+        return list(self._by_difficulty.get(difficulty, []))
     
     def save(self, problem: Dict) -> None:
         """Guarda un problema."""
-        category = problem.get("category", "general")
-        problem_id = problem.get("id", "unknown")
+        self.save_many([problem])
+    
+    def save_many(self, problems: Iterable[Dict]) -> None:
+        """
+        Guarda varios problemas regenerando el índice agregado una sola vez.
+        """
+        for problem in problems:
+            category = problem.get("category", "general")
+            problem_id = problem.get("id", "unknown")
+            
+            # _write_json crea la carpeta de la categoría si no existe
+            filepath = self.problems_dir / category / f"{problem_id}.json"
+            self._write_json(filepath, problem)
         
-        category_dir = self.problems_dir / category
-        category_dir.mkdir(parents=True, exist_ok=True)
+        # Sin marca válida la siguiente consulta relee el disco (y regenera el
+        # índice); la caché anterior sigue disponible mientras tanto para
+        # otros hilos
+        with self._lock:
+            self._problems_token = None
+            self._seen_at = float("-inf")
+        self._refresh_cache()
+    
+    def get_last_modified(self) -> int:
+        """
+        Obtiene una marca de la última modificación de los problemas.
         
-        filepath = category_dir / f"{problem_id}.json"
-        self._write_json(filepath, problem)
+        Combina la fecha de modificación más reciente (ns) de las categorías
+        y sus archivos JSON con los nombres de categorías y archivos, así que
+        cambia al añadir, quitar o editar problemas o categorías. Es un entero
+        opaco que sirve como token para invalidar cachés sin volver a leer el
+        contenido de los archivos. El índice agregado no influye en ella.
+        
+        La marca queda registrada, así que una consulta inmediatamente
+        posterior no vuelve a recorrer el disco.
+        """
+        token = self._scan_token()
+        with self._lock:
+            self._seen_token, self._seen_at = token, time.monotonic()
+        return token
     
-    def get_categories(self) -> List[str]:
-        """Obtiene las categorías disponibles."""
-        categories = []
+    def _scan_token(self) -> int:
+        """Calcula la marca de `get_last_modified` recorriendo el disco."""
+        if not self.problems_dir.exists():
+            return 0
         
-        for item in self.problems_dir.iterdir():
-            if item.is_dir() and not item.name.startswith("_"):
-                categories.append(item.name)
+        latest = 0
+        names = []
+        with os.scandir(self.problems_dir) as categories:
+            for category in categories:
+                if not category.is_dir() or category.name.startswith("_"):
+                    continue
+                names.append(category.name)
+                latest = max(latest, category.stat().st_mtime_ns)
+                with os.scandir(category.path) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".json"):
+                            names.append(f"{category.name}/{entry.name}")
+                            latest = max(latest, entry.stat().st_mtime_ns)
         
-        return sorted(categories)
+        # Los nombres entran como CRC para detectar categorías o problemas
+        # nuevos o eliminados aunque no cambie ninguna fecha
+        return (latest << 32) | zlib.crc32("\0".join(sorted(names)).encode("utf-8"))
+    
+    def get_categories(self) -> List[str]:
+        """Obtiene las categorías disponibles."""
+        self._refresh_cache()
+        return list(self._categories)
     
     def get_problems_with_solver(self, solver_name: str) -> List[Dict]:
         """Obtiene problemas relacionados con un solver específico."""
-        return [
-            p for p in self.get_all()
-            if p.get("related_solver") == solver_name
-        ]
+        self._refresh_cache()
+        return list(self._by_solver.get(solver_name, []))
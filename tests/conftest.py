@@ -0,0 +1,11 @@
+"""
+Configuración común de pytest.
+"""
+
+import sys
+from pathlib import Path
+
+# Los módulos de la aplicación se importan desde src/, igual que en main.py
+src_dir = Path(__file__).resolve().parent.parent / "src"
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
@@ -0,0 +1,244 @@
+"""
+Tests de los repositorios JSON.
+"""
+
+import json
+import os
+
+import pytest
+
+from infrastructure import json_repository
+from infrastructure.json_repository import (
+    BibliographyRepository,
+    JsonRepository,
+    ProblemRepository,
+)
+
+
+def _write(path, data):
+    """Escribe un JSON directamente en disco (edición externa)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def _bump_mtime(path):
+    """Adelanta la fecha de modificación para no depender de su resolución."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def no_revalidate_window(monkeypatch):
+    """Hace que cada consulta vuelva a comprobar el disco."""
+    monkeypatch.setattr(json_repository, "_REVALIDATE_S", 0.0)
+
+
+@pytest.fixture
+def problems_dir(tmp_path):
+    """Directorio de datos con dos problemas de osmosis."""
+    for i in (1, 2):
+        _write(
+            tmp_path / "problems" / "osmosis" / f"problema_00{i}.json",
+            {"id": f"osm-00{i}", "title": f"Problema {i}", "category": "osmosis", "difficulty": i},
+        )
+    return tmp_path
+
+
+def _ids(problems):
+    return sorted(p["id"] for p in problems)
+
+
+def _track_reads(repo):
+    """Registra los nombres de los archivos JSON que lee el repositorio."""
+    read = []
+    original = repo._read_json
+    repo._read_json = lambda path: read.append(path.name) or original(path)
+    return read
+
+
+class TestReadJsonCache:
+    """Caché de archivos parseados de JsonRepository._read_json."""
+    
+    def test_returns_cached_object_while_unchanged(self, tmp_path):
+        repo = JsonRepository(tmp_path)
+        path = tmp_path / "data.json"
+        _write(path, {"value": 1})
+        
+        assert repo._read_json(path) is repo._read_json(path)
+    
+    def test_external_edit_invalidates(self, tmp_path):
+        repo = JsonRepository(tmp_path)
+        path = tmp_path / "data.json"
+        _write(path, {"value": 1})
+        assert repo._read_json(path) == {"value": 1}
+        
+        _write(path, {"value": 2})
+        _bump_mtime(path)
+        
+        assert repo._read_json(path) == {"value": 2}
+    
+    def test_deleted_file_returns_none(self, tmp_path):
+        repo = JsonRepository(tmp_path)
+        path = tmp_path / "data.json"
+        _write(path, {"value": 1})
+        repo._read_json(path)
+        
+        path.unlink()
+        
+        assert repo._read_json(path) is None
+
+
+class TestWriteJson:
+    """Escritura atómica de JsonRepository._write_json."""
+    
+    def test_leaves_no_temporary_file(self, tmp_path):
+        repo = JsonRepository(tmp_path)
+        path = tmp_path / "sub" / "data.json"
+        
+        repo._write_json(path, {"a": 1})
+        repo._write_json(path, {"a": 2}, compact=True)
+        
+        assert json.loads(path.read_text(encoding="utf-8")) == {"a": 2}
+        assert sorted(p.name for p in path.parent.iterdir()) == ["data.json"]
+    
+    def test_recreates_deleted_directory(self, tmp_path):
+        repo = JsonRepository(tmp_path)
+        path = tmp_path / "sub" / "data.json"
+        repo._write_json(path, {"a": 1})
+        
+        path.unlink()
+        path.parent.rmdir()
+        repo._write_json(path, {"a": 2})
+        
+        assert json.loads(path.read_text(encoding="utf-8")) == {"a": 2}
+    
+    def test_write_invalidates_cache(self, tmp_path):
+        repo = JsonRepository(tmp_path)
+        path = tmp_path / "data.json"
+        repo._write_json(path, {"a": 1})
+        assert repo._read_json(path) == {"a": 1}
+        
+        repo._write_json(path, {"a": 2})
+        
+        assert repo._read_json(path) == {"a": 2}
+
+
+class TestProblemRepository:
+    """Caché, índices e índice agregado de ProblemRepository."""
+    
+    def test_loads_and_indexes_problems(self, problems_dir):
+        repo = ProblemRepository(problems_dir)
+        
+        assert _ids(repo.get_all()) == ["osm-001", "osm-002"]
+        assert repo.get_categories() == ["osmosis"]
+        assert repo.get_by_id("osm-002")["title"] == "Problema 2"
+        assert _ids(repo.get_by_difficulty(1)) == ["osm-001"]
+        assert repo.get_by_category("otra") == []
+    
+    def test_external_add_and_delete_are_seen(self, problems_dir, no_revalidate_window):
+        repo = ProblemRepository(problems_dir)
+        assert _ids(repo.get_all()) == ["osm-001", "osm-002"]
+        
+        _write(
+            problems_dir / "problems" / "membranas" / "problema_003.json",
+            {"id": "mem-003", "category": "membranas", "difficulty": 3},
+        )
+        assert _ids(repo.get_all()) == ["mem-003", "osm-001", "osm-002"]
+        assert repo.get_categories() == ["membranas", "osmosis"]
+        
+        (problems_dir / "problems" / "osmosis" / "problema_001.json").unlink()
+        assert _ids(repo.get_all()) == ["mem-003", "osm-002"]
+        assert repo.get_by_id("osm-001") is None
+    
+    def test_detected_change_is_loaded_without_second_walk(self, problems_dir):
+        repo = ProblemRepository(problems_dir)
+        repo.get_all()
+        _write(
+            problems_dir / "problems" / "osmosis" / "problema_003.json",
+            {"id": "osm-003", "category": "osmosis"},
+        )
+        
+        # Como la vista: primero la marca, después los datos
+        repo.get_last_modified()
+        scans = []
+        original = repo._scan_token
+        repo._scan_token = lambda: scans.append(1) or original()
+        
+        assert _ids(repo.get_all()) == ["osm-001", "osm-002", "osm-003"]
+        assert scans == []
+    
+    def test_save_rebuilds_index(self, problems_dir, no_revalidate_window):
+        repo = ProblemRepository(problems_dir)
+        repo.save({"id": "osm-003", "category": "osmosis", "difficulty": 2})
+        
+        index = json.loads(repo.problems_index.read_text(encoding="utf-8"))
+        assert index["token"] == str(repo.get_last_modified())
+        assert sorted(p["data"]["id"] for p in index["problems"]) == ["osm-001", "osm-002", "osm-003"]
+        
+        # Borrar un problema deja el índice obsoleto: no debe usarse
+        (problems_dir / "problems" / "osmosis" / "osm-003.json").unlink()
+        fresh = ProblemRepository(problems_dir)
+        assert _ids(fresh.get_all()) == ["osm-001", "osm-002"]
+        
+        fresh.save({"id": "osm-004", "category": "osmosis", "difficulty": 1})
+        index = json.loads(fresh.problems_index.read_text(encoding="utf-8"))
+        assert sorted(p["data"]["id"] for p in index["problems"]) == ["osm-001", "osm-002", "osm-004"]
+    
+    def test_first_load_writes_index(self, problems_dir):
+        ProblemRepository(problems_dir).get_all()
+        
+        repo = ProblemRepository(problems_dir)
+        read = _track_reads(repo)
+        
+        assert _ids(repo.get_all()) == ["osm-001", "osm-002"]
+        assert read == ["_index.json"]
+    
+    def test_stale_index_is_not_parsed(self, problems_dir):
+        ProblemRepository(problems_dir).get_all()
+        _write(
+            problems_dir / "problems" / "osmosis" / "problema_003.json",
+            {"id": "osm-003", "category": "osmosis"},
+        )
+        
+        repo = ProblemRepository(problems_dir)
+        read = _track_reads(repo)
+        
+        assert _ids(repo.get_all()) == ["osm-001", "osm-002", "osm-003"]
+        assert "_index.json" not in read
+        # Se regenera para el siguiente arranque
+        token = repo.problems_index_token.read_text(encoding="utf-8")
+        assert token == str(repo.get_last_modified())
+    
+    def test_save_many_round_trip(self, problems_dir, no_revalidate_window):
+        repo = ProblemRepository(problems_dir)
+        problems = [dict(p, title="Editado") for p in repo.get_all()]
+        problems.append({"id": "osm-003", "category": "osmosis", "difficulty": 5})
+        
+        repo.save_many(problems)
+        
+        fresh = ProblemRepository(problems_dir)
+        assert fresh.get_by_id("osm-003")["difficulty"] == 5
+        assert fresh.get_by_id("osm-001")["title"] == "Editado"
+        
+        index = json.loads(fresh.problems_index.read_text(encoding="utf-8"))
+        stored = [p["data"] for p in index["problems"]]
+        stored += [
+            json.loads(path.read_text(encoding="utf-8"))
+            for path in (problems_dir / "problems" / "osmosis").glob("*.json")
+        ]
+        assert all(not key.startswith("_") for data in stored for key in data)
+
+
+class TestBibliographyRepository:
+    """Guardado de libros de BibliographyRepository."""
+    
+    def test_save_books_merges_by_id(self, tmp_path):
+        repo = BibliographyRepository(tmp_path)
+        repo.save_books([{"id": "a", "title": "A"}, {"id": "b", "title": "B"}])
+        
+        repo.save_books([{"id": "a", "title": "A2"}, {"id": "c", "title": "C"}])
+        
+        assert [(b["id"], b["title"]) for b in repo.get_all_books()] == [
+            ("a", "A2"), ("b", "B"), ("c", "C")
+        ]
+        assert repo.get_by_id("a")["title"] == "A2"